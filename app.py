@@ -1,22 +1,27 @@
 # app.py
 
 import streamlit as st
-import os
 import logging
+import queue
 import time
-from jinja2 import Template
+from concurrent.futures import ThreadPoolExecutor
 from utils import (
     get_recommended_projects,
-    analyze_project_culture,
-    generate_contribution_guidelines,
-    summarize_text,
-    translate_text_with_claude,
+    stream_summarize_text,
+    stream_translate_text_with_claude,
     load_language,
     format_number,
+    get_github_rate_limit,
+    GitHubRateLimitError,
 )
+from tasks import submit_analysis, submit_pdf_export, get_job
+from jobs import JobQueueFull, DONE, FAILED
+from precomputed import SUMMARY, CULTURE_ANALYSIS, GUIDELINES
+from pdf_export import report_url
+from records import SearchState
+import clients
+import metrics
 import config
-import boto3
-import pdfkit
 
 # Configure logging
 logging.basicConfig(
@@ -29,10 +34,9 @@ logging.basicConfig(
 )
 
 # Initialize session state
-if 'analyzed_projects' not in st.session_state:
-    st.session_state['analyzed_projects'] = {}
-if 'recommended_projects' not in st.session_state:
-    st.session_state['recommended_projects'] = []
+# 검색 결과와 요약/분석 결과는 SearchState 하나에 담고, 긴 텍스트 본문은 공유 텍스트 저장소에 둠
+if 'search' not in st.session_state:
+    st.session_state['search'] = None
 if 'search_performed' not in st.session_state:
     st.session_state['search_performed'] = False
 if "language" not in st.session_state:
@@ -44,8 +48,13 @@ if "target_language" not in st.session_state:
 
 # AWS S3 Configuration
 S3_BUCKET_NAME = config.S3_BUCKET_NAME
-S3_REGION_NAME = config.AWS_REGION
-s3_client = boto3.client('s3', region_name=S3_REGION_NAME)
+
+# Prometheus 형식 지표 엔드포인트 (프로세스당 한 번만 시작)
+if config.METRICS_PORT:
+    metrics.start_http_server(config.METRICS_PORT)
+
+# warm.py가 미리 계산한 결과 (유효한 항목이 있으면 실시간 호출 대신 사용)
+precomputed_index = clients.get_precomputed_index()
 
 # 세션 상태에 따라 언어팩 로드
 language_pack = load_language(st.session_state["language"])
@@ -56,30 +65,138 @@ st.set_page_config(
     layout="wide",
 )
 
-def analyze_project(idx, project, language_pack):
-    """프로젝트를 분석하고 세션 상태를 업데이트하는 헬퍼 함수"""
-    with st.spinner(f"{language_pack.get('analyzing_culture_message', 'Analyzing culture for')} {project['name']}..."):
-        # 프로젝트 문화 분석
-        culture_analysis = analyze_project_culture(project['name'], project['readme'])
-        st.session_state['analyzed_projects'][idx]['culture_analysis'] = culture_analysis
+def render_stream(placeholder, chunks):
+    """스트리밍되는 텍스트 조각을 placeholder에 이어 붙여 표시하고 최종 텍스트를 반환하는 헬퍼 함수"""
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        placeholder.markdown(text + "▌")
+    placeholder.markdown(text)
+    return text
 
-    with st.spinner(f"{language_pack.get('generating_guidelines_message', 'Generating guidelines for')} {project['name']}..."):
-        # 기여 가이드라인 생성
-        guidelines = generate_contribution_guidelines(project['name'])
-        st.session_state['analyzed_projects'][idx]['guidelines'] = guidelines
+def fill_summaries(search, indices, placeholders, target_language):
+    """
+    요약(과 번역)이 없는 프로젝트들의 요약을 동시에 생성하고, 도착하는 조각으로 각 카드의 placeholder를 채우는 헬퍼 함수.
+    Streamlit 요소는 스크립트 스레드에서만 갱신할 수 있으므로 작업 스레드는 큐로 결과를 전달함
+    """
+    updates = queue.Queue()
+
+    def stream_into_queue(idx, chunks):
+        text = ""
+        for chunk in chunks:
+            text += chunk
+            updates.put(('progress', idx, text))
+        return text
+
+    def produce(idx, project):
+        text = None
+        try:
+            summary = search.get(idx, SUMMARY) or precomputed_index.get_artifact(project.name, SUMMARY)
+            if summary is None:
+                summary = stream_into_queue(idx, stream_summarize_text(project.readme))
+            updates.put(('summary', idx, summary))
+            text = summary
 
+            if target_language:
+                # 번역문은 원문 요약이 표시되던 자리를 이어서 채움
+                translated_summary = precomputed_index.get_artifact(project.name, SUMMARY, target_language)
+                if translated_summary is None:
+                    translated_summary = stream_into_queue(
+                        idx, stream_translate_text_with_claude(summary, target_language)
+                    )
+                updates.put(('translation', idx, translated_summary))
+                text = translated_summary
+        except Exception as e:
+            logging.error(f"Error summarizing {project.name}: {e}")
+            text = text or f"Error during summarization: {e}"
+        finally:
+            updates.put(('done', idx, text))
+
+    executor = ThreadPoolExecutor(max_workers=len(indices), thread_name_prefix="summary")
+    try:
+        for idx in indices:
+            executor.submit(produce, idx, search.projects[idx])
+        remaining = len(indices)
+        while remaining:
+            kind, idx, text = updates.get()
+            if kind == 'progress':
+                placeholders[idx].markdown(text + "▌")
+            elif kind == 'summary':
+                search.put(idx, SUMMARY, text)
+            elif kind == 'translation':
+                search.put(idx, SUMMARY, text, target_language)
+            else:
+                placeholders[idx].write(text)
+                remaining -= 1
+    finally:
+        # 사용자가 중간에 다른 버튼을 눌러 스크립트가 중단되어도 기다리지 않음 (남은 응답은 LLM 캐시에 저장됨)
+        executor.shutdown(wait=False)
+
+def save_analysis(search, idx, analysis, target_language):
+    """분석 결과 딕셔너리(작업 결과 또는 미리 계산된 결과)를 검색 상태에 저장하는 헬퍼 함수"""
+    for kind in (CULTURE_ANALYSIS, GUIDELINES):
+        search.put(idx, kind, analysis[kind])
+        if target_language and analysis.get(f'translated_{kind}'):
+            search.put(idx, kind, analysis[f'translated_{kind}'], target_language)
+
+def analyze_project(search, idx, project, language_pack):
+    """프로젝트 분석 작업을 백그라운드 큐에 제출하고 작업 ID를 검색 상태에 저장하는 헬퍼 함수"""
     target_language = st.session_state.get('target_language', '').strip()
-    if target_language:
-        with st.spinner(f"Translating culture analysis into {target_language}..."):
-            translated_culture_analysis = translate_text_with_claude(culture_analysis, target_language)
-            st.session_state['analyzed_projects'][idx]['translated_culture_analysis'] = translated_culture_analysis
-        with st.spinner(f"Translating guidelines into {target_language}..."):
-            translated_guidelines = translate_text_with_claude(guidelines, target_language)
-            st.session_state['analyzed_projects'][idx]['translated_guidelines'] = translated_guidelines
-
-    # 프로젝트 검색 여부 플래그를 업데이트하여 UI 즉시 반영
+
+    # 미리 계산된 분석 결과가 있으면 작업 없이 바로 사용
+    precomputed_analysis = precomputed_index.get_analysis(project.name, target_language)
+    if precomputed_analysis is not None:
+        save_analysis(search, idx, precomputed_analysis, target_language)
+        st.experimental_rerun()
+
+    try:
+        # 공유 저장소에서 README가 사라졌으면 다시 가져오며, 실패하면 대체 문구로 분석하지 않음
+        readme = project.readme
+    except Exception as e:
+        st.error(f"Could not load the README of {project.name}: {e}")
+        logging.error(f"README reload for {project.name} failed: {e}")
+        return
+
+    try:
+        job_id = submit_analysis(project.name, readme, target_language)
+    except JobQueueFull:
+        st.warning("The server is busy right now. Please try again in a moment.")
+        return
+    search.set_job(idx, 'analysis', job_id)
+
+    # 작업 진행 상황을 바로 표시하기 위해 페이지를 다시 렌더링
     st.experimental_rerun()
 
+def poll_analysis_job(search, idx, project, language_pack):
+    """
+    분석 작업 상태를 확인하는 헬퍼 함수.
+    완료된 결과는 검색 상태에 반영하고, 진행 중이면 부분 결과를 표시한 뒤 True를 반환
+    """
+    job = get_job(search.job(idx, 'analysis'))
+    target_language = st.session_state.get('target_language', '').strip()
+
+    if job is None or job['status'] == FAILED:
+        error = job['error'] if job else "Job not found."
+        st.error(f"An error occurred while analyzing {project.name}: {error}")
+        logging.error(f"Analysis job for {project.name} failed: {error}")
+        search.set_job(idx, 'analysis', None)
+        return False
+
+    if job['status'] == DONE:
+        save_analysis(search, idx, job['result'], target_language)
+        search.set_job(idx, 'analysis', None)
+        return False
+
+    # 번역 결과가 있으면 원문 대신 표시
+    partial = job['progress']
+    label_suffix = f" ({target_language})" if target_language else ""
+    st.info(f"{language_pack.get('analyzing_culture_message', 'Analyzing culture for')} {project.name}...")
+    st.markdown(f"### {language_pack.get('culture_analysis_label', 'Culture Analysis')}{label_suffix}")
+    st.write(partial.get('translated_culture_analysis') or (partial.get('culture_analysis', '') + "▌"))
+    st.markdown(f"### {language_pack.get('guidelines_label', 'Contribution Guidelines')}{label_suffix}")
+    st.write(partial.get('translated_guidelines') or (partial.get('guidelines', '') + "▌"))
+    return True
+
 # 언어 전환 버튼
 col1, col2 = st.columns([9, 1])  # 언어 버튼을 오른쪽에 위치시키기 위한 열 너비 조정
 with col1:
@@ -141,30 +258,44 @@ if submit_button:
         st.session_state['search_performed'] = True
         st.session_state['target_language'] = target_language
         with st.spinner(language_pack.get("fetching_projects_message", "Fetching recommended projects...")):
-            recommended_projects = get_recommended_projects(tech_stack, interest_areas)
-            st.session_state['recommended_projects'] = recommended_projects
-            # Initialize analyzed_projects entries for new search
-            st.session_state['analyzed_projects'] = {
-                idx: {
-                    'project_info': project,
-                    'culture_analysis': None,
-                    'guidelines': None
-                }
-                for idx, project in enumerate(recommended_projects)
-            }
+            try:
+                recommended_projects = precomputed_index.get_projects(tech_stack, interest_areas)
+                if recommended_projects is None:
+                    recommended_projects = get_recommended_projects(tech_stack, interest_areas)
+            except GitHubRateLimitError:
+                # GitHub 검색 한도를 초과한 경우 오류 대신 이전 결과를 유지하고 안내
+                recommended_projects = None
+                rate_limit = get_github_rate_limit('search')
+                retry_at = time.strftime('%H:%M:%S', time.localtime(rate_limit['reset'])) if rate_limit else None
+                st.warning(
+                    "GitHub search rate limit reached. "
+                    + (f"Please try again after {retry_at}." if retry_at else "Please try again in a minute.")
+                )
+                logging.warning("GitHub search rate limit reached.")
+
+            if recommended_projects is not None:
+                # 이전 검색의 요약, 분석, 작업 ID는 검색 상태와 함께 교체됨
+                st.session_state['search'] = SearchState(recommended_projects)
+
+# 진행 중인 백그라운드 작업이 있으면 스크립트 끝에서 다시 렌더링하여 상태를 갱신
+jobs_in_progress = False
 
 # Display projects if search has been performed
 if st.session_state['search_performed']:
     st.header(language_pack.get("header_2", "2. Project Recommendations"))
     
-    if not st.session_state['recommended_projects']:
+    search = st.session_state['search']
+    if search is None or not search.projects:
         st.warning(language_pack.get("no_projects_warning", "No projects found. Please try different inputs."))
     else:
-        for idx, project in enumerate(st.session_state['recommended_projects']):
-            st.subheader(f"{idx + 1}. {project['name']}")
+        # 카드는 GitHub 메타데이터로 먼저 모두 그리고, 요약은 목록을 그린 뒤 동시에 채움
+        summary_placeholders = {}
+        pending_summaries = []
+        for idx, project in enumerate(search.projects):
+            st.subheader(f"{idx + 1}. {project.name}")
             
             # GitHub Readme Stats API를 사용하여 프로젝트 정보 표시
-            repo_url = project['url']
+            repo_url = project.url
             try:
                 # GitHub URL에서 사용자명과 리포지토리명 추출
                 repo_path = repo_url.replace("https://github.com/", "").strip("/")
@@ -177,7 +308,7 @@ if st.session_state['search_performed']:
                 st.markdown(
                     f"""
                     <a href="{repo_url}" target="_blank">
-                        <img src="{readme_stats_url}" alt="{project['name']}" style="width:400px;">
+                        <img src="{readme_stats_url}" alt="{project.name}" style="width:400px;">
                     </a>
                     """,
                     unsafe_allow_html=True
@@ -189,131 +320,127 @@ if st.session_state['search_performed']:
             st.markdown('<br>', unsafe_allow_html=True)  # 줄바꿈 추가
             
             # Description과 GitHub Stats 사이에 구분선 추가
-            st.write(f"**{language_pack.get('description_label', 'Description')}:** {project['description']}")
+            st.write(f"**{language_pack.get('description_label', 'Description')}:** {project.description}")
 
             st.markdown("---")  # 구분선 추가
 
-            # 요약이 완료되지 않은 경우 요약 생성
-            if f"summary_{idx}" not in st.session_state:
-                with st.spinner(language_pack.get("generating_summary_message", f'Generating summary for {project["name"]}...')):
-                    summary = summarize_text(project['readme'])
-                    st.session_state[f"summary_{idx}"] = summary
-            else:
-                summary = st.session_state[f"summary_{idx}"]
-
             target_language = st.session_state.get('target_language', '').strip()
             if target_language:
-                if f"translated_summary_{idx}" not in st.session_state:
-                    with st.spinner(f"Translating summary into {target_language}..."):
-                        translated_summary = translate_text_with_claude(summary, target_language)
-                        st.session_state[f"translated_summary_{idx}"] = translated_summary
-                else:
-                    translated_summary = st.session_state[f"translated_summary_{idx}"]
-
                 st.markdown(f"**{language_pack.get('summary_label', 'Summary')} ({target_language}):**")
-                st.write(translated_summary)
             else:
                 st.markdown(f"**{language_pack.get('summary_label', 'Summary')}:**")
-                st.write(summary)
+            summary_placeholder = st.empty()
+
+            # 저장된 요약이 있으면 바로 표시하고, 없으면 자리만 잡아 둠
+            summary = search.get(idx, SUMMARY, target_language) if target_language else search.get(idx, SUMMARY)
+            if summary is None:
+                summary_placeholders[idx] = summary_placeholder
+                pending_summaries.append(idx)
+                summary_placeholder.markdown(f"_{language_pack.get('summarizing_message', 'Summarizing...')}_")
+            else:
+                summary_placeholder.write(summary)
 
-            # 프로젝트 분석 버튼에 고유 키 부여
-            analyze_key = f"analyze_button_{idx}"
+            # 프로젝트 분석 버튼에 검색마다 고유한 키 부여
+            analyze_key = f"analyze_button_{search.search_id}_{idx}"
             
+            # 진행 중인 분석 작업이 있으면 상태를 확인
+            analysis_running = bool(search.job(idx, 'analysis')) and poll_analysis_job(search, idx, project, language_pack)
+            culture_analysis = search.get(idx, CULTURE_ANALYSIS)
+
             # 프로젝트 분석 여부에 따라 버튼 출력
-            project_data = st.session_state['analyzed_projects'].get(idx, {})
-            if project_data.get('culture_analysis') is None:
-                if st.button(f"{language_pack.get('analyze_button_label', 'Analyze')} {project['name']}", key=analyze_key):
-                    analyze_project(idx, project, language_pack)  # 분석 후 페이지를 다시 렌더링하여 결과 즉시 표시
+            if analysis_running:
+                jobs_in_progress = True
+            elif culture_analysis is None:
+                if st.button(f"{language_pack.get('analyze_button_label', 'Analyze')} {project.name}", key=analyze_key):
+                    analyze_project(search, idx, project, language_pack)  # 작업 제출 후 페이지를 다시 렌더링하여 진행 상황 표시
             else:
+                guidelines = search.get(idx, GUIDELINES)
                 target_language = st.session_state.get('target_language', '').strip()
                 if target_language:
                     # Retrieve or translate the culture analysis
-                    translated_culture_analysis = project_data.get('translated_culture_analysis')
-                    if not translated_culture_analysis:
-                        with st.spinner(f"Translating culture analysis into {target_language}..."):
-                            translated_culture_analysis = translate_text_with_claude(project_data['culture_analysis'], target_language)
-                            st.session_state['analyzed_projects'][idx]['translated_culture_analysis'] = translated_culture_analysis
+                    st.markdown(f"### {language_pack.get('culture_analysis_label', 'Culture Analysis')} ({target_language})")
+                    culture_placeholder = st.empty()
+                    translated_culture_analysis = search.get(idx, CULTURE_ANALYSIS, target_language)
+                    if translated_culture_analysis is None:
+                        translated_culture_analysis = (
+                            precomputed_index.get_artifact(project.name, CULTURE_ANALYSIS, target_language)
+                            or render_stream(
+                                culture_placeholder,
+                                stream_translate_text_with_claude(culture_analysis, target_language),
+                            )
+                        )
+                        search.put(idx, CULTURE_ANALYSIS, translated_culture_analysis, target_language)
+                    culture_placeholder.write(translated_culture_analysis)
 
                     # Retrieve or translate the guidelines
-                    translated_guidelines = project_data.get('translated_guidelines')
-                    if not translated_guidelines:
-                        with st.spinner(f"Translating guidelines into {target_language}..."):
-                            translated_guidelines = translate_text_with_claude(project_data['guidelines'], target_language)
-                            st.session_state['analyzed_projects'][idx]['translated_guidelines'] = translated_guidelines
-
-                    st.markdown(f"### {language_pack.get('culture_analysis_label', 'Culture Analysis')} ({target_language})")
-                    st.write(translated_culture_analysis)
                     st.markdown(f"### {language_pack.get('guidelines_label', 'Contribution Guidelines')} ({target_language})")
-                    st.write(translated_guidelines)
+                    guidelines_placeholder = st.empty()
+                    translated_guidelines = search.get(idx, GUIDELINES, target_language)
+                    if translated_guidelines is None:
+                        translated_guidelines = (
+                            precomputed_index.get_artifact(project.name, GUIDELINES, target_language)
+                            or render_stream(
+                                guidelines_placeholder,
+                                stream_translate_text_with_claude(guidelines, target_language),
+                            )
+                        )
+                        search.put(idx, GUIDELINES, translated_guidelines, target_language)
+                    guidelines_placeholder.write(translated_guidelines)
                 else:
                     st.markdown(f"### {language_pack.get('culture_analysis_label', 'Culture Analysis')}")
-                    st.write(project_data['culture_analysis'])
+                    st.write(culture_analysis)
                     st.markdown(f"### {language_pack.get('guidelines_label', 'Contribution Guidelines')}")
-                    st.write(project_data['guidelines'])
+                    st.write(guidelines)
 
             st.markdown('<hr class="custom-divider">', unsafe_allow_html=True)  # 구분선 추가
 
         # PDF Generation Section
-        if any(data.get('culture_analysis') is not None for data in st.session_state['analyzed_projects'].values()):
+        target_language = st.session_state.get('target_language', '').strip()
+        analyzed = [idx for idx in range(len(search.projects)) if search.get(idx, CULTURE_ANALYSIS) is not None]
+        if analyzed:
             if st.button("Generate PDF and Upload to S3"):
-                with st.spinner("Generating PDF and uploading to S3..."):
-                    try:
-                        # Collect only analyzed projects for PDF
-                        project_data = [
-                            {
-                                'name': data['project_info']['name'],
-                                'description': data['project_info']['description'],
-                                'url': data['project_info']['url'],
-                                'culture_analysis': data.get('translated_culture_analysis', data['culture_analysis']),
-                                'guidelines': data.get('translated_guidelines', data['guidelines'])
-                            }
-                            for data in st.session_state['analyzed_projects'].values()
-                            if data['culture_analysis'] is not None
-                        ]
-
-                        # Generate HTML content using Jinja2 template
-                        template_path = 'templates/pdf_template.html'
-                        with open(template_path, encoding='utf-8') as f:
-                            template = Template(f.read())
-
-                        html_content = template.render(projects=project_data)
-                        
-                        # Setup paths
-                        output_dir = os.path.join(os.getcwd(), 'output_files')
-                        os.makedirs(output_dir, exist_ok=True)
-                        html_path = os.path.join(output_dir, 'temp.html')
-                        pdf_path = os.path.join(output_dir, 'project_details.pdf')
-
-                        # Generate PDF
-                        with open(html_path, 'w', encoding='utf-8') as f:
-                            f.write(html_content)
-
-                        wkhtmltopdf_path = '/usr/bin/wkhtmltopdf'
-                        config_pdfkit = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
-                        options = {
-                            'encoding': 'UTF-8',
-                            'enable-local-file-access': None,
-                        }
-                        pdfkit.from_file(html_path, pdf_path, configuration=config_pdfkit, options=options)
-
-                        # Upload to S3
-                        s3_key = f'project_details_{int(time.time())}.pdf'
-                        s3_client.upload_file(pdf_path, S3_BUCKET_NAME, s3_key)
-                        
-                        # Generate download link
-                        presigned_url = s3_client.generate_presigned_url(
-                            'get_object',
-                            Params={'Bucket': S3_BUCKET_NAME, 'Key': s3_key},
-                            ExpiresIn=3600
-                        )
-
-                        st.success("PDF generated and uploaded to S3.")
-                        st.markdown(f"**Download your PDF here:** [Download PDF]({presigned_url})")
+                # Collect only analyzed projects for PDF
+                project_data = [
+                    {
+                        'name': search.projects[idx].name,
+                        'description': search.projects[idx].description,
+                        'url': search.projects[idx].url,
+                        'culture_analysis': (
+                            search.get(idx, CULTURE_ANALYSIS, target_language) if target_language else None
+                        ) or search.get(idx, CULTURE_ANALYSIS),
+                        'guidelines': (
+                            search.get(idx, GUIDELINES, target_language) if target_language else None
+                        ) or search.get(idx, GUIDELINES),
+                    }
+                    for idx in analyzed
+                ]
+                try:
+                    # 메모리에서 PDF를 만들고 내용 해시를 키로 업로드하는 작업을 백그라운드로 실행
+                    search.set_job(None, 'pdf_export', submit_pdf_export(project_data, S3_BUCKET_NAME))
+                except JobQueueFull:
+                    st.warning("The server is busy right now. Please try again in a moment.")
+
+        if search.job(None, 'pdf_export'):
+            pdf_job = get_job(search.job(None, 'pdf_export'))
+            if pdf_job is None or pdf_job['status'] == FAILED:
+                error = pdf_job['error'] if pdf_job else "Job not found."
+                st.error(f"An error occurred: {error}")
+                logging.error(f"PDF Generation or S3 Upload Error: {error}")
+                search.set_job(None, 'pdf_export', None)
+            elif pdf_job['status'] == DONE:
+                st.success("PDF generated and uploaded to S3.")
+                # 링크가 만료되지 않도록 보여줄 때마다 presigned URL을 새로 발급
+                result = pdf_job['result']
+                pdf_url = report_url(clients.get_s3(), S3_BUCKET_NAME, result['key']) if 'key' in result else result['url']
+                st.markdown(f"**Download your PDF here:** [Download PDF]({pdf_url})")
+            else:
+                st.info("Generating PDF and uploading to S3...")
+                jobs_in_progress = True
 
-                        # Cleanup
-                        os.remove(pdf_path)
-                        os.remove(html_path)
+        # 페이지 전체가 그려진 뒤 비어 있는 요약을 동시에 생성 (가장 느린 요약 하나만큼만 기다림)
+        if pending_summaries:
+            fill_summaries(search, pending_summaries, summary_placeholders, target_language)
 
-                    except Exception as e:
-                        st.error(f"An error occurred: {e}")
-                        logging.error(f"PDF Generation or S3 Upload Error: {e}")
\ No newline at end of file
+if jobs_in_progress:
+    time.sleep(config.JOB_POLL_INTERVAL)
+    st.experimental_rerun()
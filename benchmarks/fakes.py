@@ -0,0 +1,202 @@
+# benchmarks/fakes.py
+
+import hashlib
+import random
+import re
+import threading
+import time
+
+
+class FakeBackendError(Exception):
+    """가짜 백엔드가 설정된 오류 비율에 따라 발생시키는 오류입니다."""
+
+
+class LatencyModel:
+    """
+    평균 지연 시간(초), 지터(초), 오류 비율로 외부 호출을 흉내냅니다.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def wait(self, name, scale=1.0):
+        with self._lock:
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter)) * scale
+            failed = self._rng.random() < self.error_rate
+        time.sleep(delay)
+        if failed:
+            raise FakeBackendError(f"Simulated {name} failure")
+
+
+# --- GitHub ---
+
+_README_TEMPLATE = """# {name}
+
+{name} is a sample project used for benchmarking.
+
+## Installation
+
+Run the installer and follow the prompts.
+
+## Contributing
+
+Pull requests are welcome. Please open an issue first to discuss what you would like to change.
+
+""" + "\n\n".join(f"## Section {i}\n\n" + "Details about this part of the project. " * 40 for i in range(8))
+
+
+class FakeContentFile:
+    def __init__(self, text):
+        self.decoded_content = text.encode('utf-8')
+        self.sha = hashlib.sha1(self.decoded_content).hexdigest()
+
+
+class FakeRepository:
+    def __init__(self, index, latency_model):
+        self.full_name = f"bench-org/project-{index}"
+        self.description = f"Benchmark project number {index}."
+        self.html_url = f"https://github.com/{self.full_name}"
+        self.forks_count = 100 * (index + 1)
+        self.stargazers_count = 10000 - index
+        self._latency = latency_model
+
+    def get_readme(self):
+        self._latency.wait("GitHub README")
+        return FakeContentFile(_README_TEMPLATE.format(name=self.full_name))
+
+
+class FakeGithub:
+    """
+    search_repositories, get_repo와 Repository.get_readme만 제공하는 가짜 PyGithub 클라이언트입니다.
+    """
+
+    def __init__(self, latency_model, results=100):
+        self._latency = latency_model
+        self._results = results
+
+    def search_repositories(self, query, sort=None, order=None):
+        self._latency.wait("GitHub search")
+        return iter([FakeRepository(i, self._latency) for i in range(self._results)])
+
+    def get_repo(self, full_name, lazy=False):
+        return FakeRepository(int(full_name.rsplit('-', 1)[1]), self._latency)
+
+
+class FakeGithubGraphQL:
+    """
+    검색(메타데이터)과 README 일괄 조회를 각각 한 번의 호출로 돌려주는 가짜 GitHub GraphQL 클라이언트입니다.
+    """
+
+    def __init__(self, latency_model, results=100):
+        self._latency = latency_model
+        self._results = results
+
+    def search_repositories(self, query, first):
+        from github_graphql import GraphQLRepository
+
+        self._latency.wait("GitHub GraphQL search")
+        repos = []
+        for i in range(min(first, self._results)):
+            repo = FakeRepository(i, self._latency)
+            repos.append(GraphQLRepository({
+                'id': repo.full_name,
+                'nameWithOwner': repo.full_name,
+                'description': repo.description,
+                'url': repo.html_url,
+                'forkCount': repo.forks_count,
+                'stargazerCount': repo.stargazers_count,
+            }))
+        return repos
+
+    def fetch_readmes(self, repos):
+        self._latency.wait("GitHub GraphQL README")
+        for repo in repos:
+            readme = FakeContentFile(_README_TEMPLATE.format(name=repo.full_name))
+            repo.set_readme({
+                'readme0': {'oid': readme.sha, 'text': readme.decoded_content.decode('utf-8'), 'isTruncated': False},
+            })
+
+
+# --- Bedrock ---
+
+class FakeMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeChatBedrock:
+    """
+    invoke와 stream을 제공하는 가짜 ChatBedrock입니다. 응답 지연은 출력 길이에 비례하지 않고 호출당 한 번 적용됩니다.
+    stream은 첫 조각 전에 지연의 절반을, 나머지를 조각마다 나누어 적용합니다.
+    """
+
+    def __init__(self, latency_model, response_words=120, chunks=12):
+        self._latency = latency_model
+        self._response_words = response_words
+        self._chunks = chunks
+
+    def _response(self, prompt):
+        digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:8]
+        # 문단 번호 표시가 있는 번역 프롬프트에는 표시를 유지한 응답을 돌려줌
+        markers = re.findall(r"^\[\[\d+\]\]$", prompt, re.MULTILINE)
+        if markers:
+            words = max(1, self._response_words // len(markers))
+            return "\n\n".join(f"{marker}\n" + " ".join(f"word{digest}" for _ in range(words)) for marker in markers)
+        return " ".join(f"word{digest}" for _ in range(self._response_words))
+
+    def invoke(self, prompt):
+        self._latency.wait("Bedrock invoke")
+        return FakeMessage(self._response(prompt))
+
+    def stream(self, prompt):
+        self._latency.wait("Bedrock stream", scale=0.5)
+        words = self._response(prompt).split(" ")
+        size = max(1, len(words) // self._chunks)
+        for start in range(0, len(words), size):
+            self._latency.wait("Bedrock stream", scale=0.5 / self._chunks)
+            yield FakeMessage(" ".join(words[start:start + size]) + " ")
+
+
+# --- S3 ---
+
+class FakeS3:
+    """
+    PDF 내보내기에 필요한 head_object, upload_fileobj, generate_presigned_url만 제공하는 가짜 S3 클라이언트입니다.
+    """
+
+    def __init__(self, latency_model):
+        self._latency = latency_model
+        self._objects = {}
+        self._lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        from botocore.exceptions import ClientError
+
+        self._latency.wait("S3 head_object")
+        with self._lock:
+            if (Bucket, Key) not in self._objects:
+                raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+            return {'ContentLength': len(self._objects[(Bucket, Key)])}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        data = fileobj.read()
+        self._latency.wait("S3 upload", scale=1 + len(data) / (1024 * 1024))
+        with self._lock:
+            self._objects[(bucket, key)] = data
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn=3600):
+        return f"https://{Params['Bucket']}.s3.amazonaws.com/{Params['Key']}?expires={ExpiresIn}"
+
+
+def fake_render_pdf(latency_model):
+    """
+    wkhtmltopdf 없이 PDF 렌더링 지연만 흉내내는 함수를 반환합니다.
+    """
+    def render_pdf(html_content):
+        latency_model.wait("PDF render")
+        return b"%PDF-1.4\n" + html_content.encode('utf-8')
+    return render_pdf
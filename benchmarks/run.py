@@ -0,0 +1,190 @@
+# benchmarks/run.py
+"""
+가짜 GitHub, Bedrock, S3 백엔드로 앱의 실제 처리 경로를 실행해 지연 시간과 처리량을 측정합니다.
+
+사용법:
+    python -m benchmarks.run --sessions 20 --concurrency 5 --llm-latency 2.0 --llm-jitter 0.5
+
+각 가상 세션은 추천 프로젝트 검색, 프로젝트별 요약과 번역, 첫 프로젝트의 분석과 번역, PDF 내보내기를 순서대로 수행합니다.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import clients
+import config
+import pdf_export
+import utils
+from benchmarks.fakes import FakeChatBedrock, FakeGithub, FakeGithubGraphQL, FakeS3, LatencyModel, fake_render_pdf
+from github_cache import GitHubHttpCache
+from llm_cache import LLMCache
+from text_store import TextStore
+from translation_memory import TranslationMemory
+
+BENCH_BUCKET = 'bench-bucket'
+
+
+class StageTimer:
+    """
+    stage별 소요 시간과 오류 수를 스레드 안전하게 모읍니다.
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def run(self, stage, func, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.errors[stage] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.samples[stage].append(elapsed)
+
+
+def percentile(values, pct):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def install_fakes(args, cache_dir):
+    """
+    클라이언트 레지스트리에 가짜 백엔드와 벤치마크 전용 캐시를 주입합니다.
+    """
+    github_latency = LatencyModel(args.github_latency, args.github_jitter, args.github_error_rate, seed=args.seed)
+    llm_latency = LatencyModel(args.llm_latency, args.llm_jitter, args.llm_error_rate, seed=args.seed + 1)
+    s3_latency = LatencyModel(args.s3_latency, args.s3_jitter, args.s3_error_rate, seed=args.seed + 2)
+    pdf_latency = LatencyModel(args.pdf_latency, args.pdf_jitter, 0.0, seed=args.seed + 3)
+
+    clients.reset()
+    clients.override('github', FakeGithub(github_latency))
+    if args.graphql:
+        clients.override('github_graphql', FakeGithubGraphQL(github_latency))
+    else:
+        # 환경에 토큰이 있어도 실제 GraphQL API를 호출하지 않도록 함
+        config.GITHUB_GRAPHQL_ENABLED = False
+    clients.override('llm', FakeChatBedrock(llm_latency))
+    clients.override('s3', FakeS3(s3_latency))
+    clients.override('github_http_cache', GitHubHttpCache(os.path.join(cache_dir, 'github_cache.sqlite3')))
+    # 캐시를 켜지 않으면 TTL 0으로 모든 호출이 백엔드까지 가도록 함
+    clients.override('llm_cache', LLMCache(
+        os.path.join(cache_dir, 'llm_cache.sqlite3'),
+        ttl=3600 if args.llm_cache else -1,
+    ))
+    # 번역 메모리와 텍스트 저장소도 실제 CACHE_DIR의 파일을 건드리지 않도록 임시 디렉터리에 만듦
+    # (번역 메모리를 켜지 않으면 최대 항목 수 0으로 저장된 번역이 바로 지워져 모든 번역이 Bedrock까지 감)
+    clients.override('translation_memory', TranslationMemory(
+        os.path.join(cache_dir, 'translation_memory.sqlite3'),
+        max_entries=50000 if args.translation_memory else 0,
+    ))
+    clients.override('text_store', TextStore(os.path.join(cache_dir, 'text_store.sqlite3')))
+    if not args.real_pdf:
+        pdf_export.render_pdf = fake_render_pdf(pdf_latency)
+
+
+def run_session(session_id, timer, target_language):
+    """
+    한 사용자가 검색, 요약 확인, 분석, PDF 내보내기를 차례로 수행하는 흐름을 흉내냅니다.
+    """
+    projects = timer.run('search', utils.get_recommended_projects, "Python", f"benchmark session {session_id}")
+
+    # 앱과 같이 프로젝트별 요약과 번역을 동시에 수행
+    def summarize(project):
+        summary = timer.run('summary', utils.summarize_text, project['readme'])
+        if target_language:
+            timer.run('translate', utils.translate_text_with_claude, summary, target_language)
+
+    with ThreadPoolExecutor(max_workers=len(projects) or 1) as executor:
+        list(executor.map(summarize, projects))
+
+    project = projects[0]
+    culture_analysis = timer.run('culture_analysis', utils.analyze_project_culture, project['name'], project['readme'])
+    guidelines = timer.run('guidelines', utils.generate_contribution_guidelines, project['name'])
+    if target_language:
+        culture_analysis = timer.run('translate', utils.translate_text_with_claude, culture_analysis, target_language)
+        guidelines = timer.run('translate', utils.translate_text_with_claude, guidelines, target_language)
+
+    report = [{
+        'name': project['name'],
+        'description': project['description'],
+        'url': project['url'],
+        'culture_analysis': culture_analysis,
+        'guidelines': guidelines,
+    }]
+    timer.run('pdf_export', pdf_export.export_pdf_report, report, clients.get_s3(), BENCH_BUCKET)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the app's request path against simulated backends.")
+    parser.add_argument("--sessions", type=int, default=20, help="total number of simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=5, help="number of sessions running at the same time")
+    parser.add_argument("--target-language", default="Korean", help="translation target ('' to disable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-cache", action="store_true", help="keep the LLM response cache enabled")
+    parser.add_argument("--translation-memory", action="store_true", help="keep the translation memory enabled")
+    parser.add_argument("--graphql", action="store_true", help="fetch search results and READMEs via the GraphQL path")
+    parser.add_argument("--real-pdf", action="store_true", help="render PDFs with wkhtmltopdf instead of a fake")
+    for backend, latency, jitter in (("github", 0.3, 0.1), ("llm", 2.0, 0.5), ("s3", 0.1, 0.05), ("pdf", 1.0, 0.2)):
+        parser.add_argument(f"--{backend}-latency", type=float, default=latency, help=f"mean {backend} latency (s)")
+        parser.add_argument(f"--{backend}-jitter", type=float, default=jitter, help=f"{backend} latency jitter (s)")
+        if backend != "pdf":
+            parser.add_argument(f"--{backend}-error-rate", type=float, default=0.0, help=f"{backend} error rate (0-1)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s %(levelname)s:%(message)s')
+    # 지표 로거는 루트 로거와 분리되어 있으므로 span 로그가 측정에 섞이지 않도록 따로 끔
+    logging.getLogger('metrics').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        install_fakes(args, cache_dir)
+        timer = StageTimer()
+        failed_sessions = 0
+
+        def session(session_id):
+            return timer.run('end_to_end', run_session, session_id, timer, args.target_language)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = [executor.submit(session, i) for i in range(args.sessions)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    failed_sessions += 1
+                    logging.warning(f"Session failed: {e}")
+        wall_time = time.perf_counter() - started
+
+    print(f"{'stage':<18}{'calls':>7}{'errors':>8}{'p50 (s)':>10}{'p95 (s)':>10}{'mean (s)':>10}")
+    for stage in ('search', 'summary', 'culture_analysis', 'guidelines', 'translate', 'pdf_export', 'end_to_end'):
+        values = timer.samples.get(stage, [])
+        if not values:
+            continue
+        print(
+            f"{stage:<18}{len(values):>7}{timer.errors[stage]:>8}"
+            f"{percentile(values, 50):>10.2f}{percentile(values, 95):>10.2f}{statistics.mean(values):>10.2f}"
+        )
+    completed = args.sessions - failed_sessions
+    print(
+        f"\n{completed}/{args.sessions} sessions completed in {wall_time:.2f}s "
+        f"at concurrency {args.concurrency}: {completed / wall_time:.2f} sessions/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
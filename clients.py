@@ -0,0 +1,207 @@
+# clients.py
+
+import threading
+
+import config
+
+# 프로세스 전체에서 공유하는 외부 서비스 클라이언트 레지스트리.
+# Streamlit은 상호작용마다 app.py를 다시 실행하지만 import된 모듈은 프로세스 안에서 유지되므로,
+# 여기서 만든 클라이언트는 모든 세션이 함께 사용합니다.
+# 무거운 라이브러리(boto3, PyGithub, langchain)는 클라이언트를 처음 사용할 때 import합니다.
+_lock = threading.RLock()
+_clients = {}
+_github_local = threading.local()
+
+
+def _get_or_create(name, factory):
+    client = _clients.get(name)
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                client = factory()
+                _clients[name] = client
+    return client
+
+
+def override(name, client):
+    """
+    레지스트리의 클라이언트를 교체합니다. 벤치마크 등에서 가짜 백엔드를 주입할 때 사용합니다.
+    """
+    with _lock:
+        _clients[name] = client
+
+
+def reset():
+    """
+    생성된 클라이언트를 모두 제거합니다. 다음 사용 시 다시 생성됩니다.
+    """
+    with _lock:
+        _clients.clear()
+
+
+def get_github_http_cache():
+    def create():
+        from github_cache import GitHubHttpCache
+        return GitHubHttpCache(config.GITHUB_CACHE_PATH)
+    return _get_or_create('github_http_cache', create)
+
+
+def get_github():
+    """
+    현재 스레드의 PyGithub 클라이언트를 반환합니다.
+    PyGithub Requester는 연결 객체에 요청 URL을 저장해 두었다가 응답을 읽으므로,
+    여러 스레드가 하나의 Requester를 함께 쓰면 다른 요청의 응답을 받을 수 있어 스레드마다 따로 만듭니다.
+    override('github', client)로 교체하면 모든 스레드에 그 클라이언트를 사용합니다.
+    """
+    overridden = _clients.get('github')
+    if overridden is not None:
+        return overridden
+
+    def install():
+        from github_cache import install_conditional_cache
+        install_conditional_cache(get_github_http_cache())
+        return object()
+    # 조건부 요청 캐시는 Github 객체 생성 전에 한 번만 설치해야 함 (reset() 뒤에는 다시 설치하고 객체도 새로 만듦)
+    installed = _get_or_create('github_connection_classes', install)
+    if getattr(_github_local, 'installed', None) is not installed:
+        from github import Github
+        # 검색 후보를 한 페이지(최대 100개)로 가져오도록 페이지 크기를 최대로 설정
+        _github_local.github = Github(config.GITHUB_API_TOKEN, per_page=100)
+        _github_local.installed = installed
+    return _github_local.github
+
+
+def get_github_graphql():
+    """
+    GitHub GraphQL 클라이언트를 반환합니다. GraphQL은 인증이 필요하므로 토큰이 없거나 꺼져 있으면 None을 반환합니다.
+    """
+    if 'github_graphql' not in _clients and not (config.GITHUB_GRAPHQL_ENABLED and config.GITHUB_API_TOKEN):
+        return None
+
+    def create():
+        from github_graphql import GitHubGraphQL
+        return GitHubGraphQL(config.GITHUB_API_TOKEN, on_response=get_github_http_cache().record_rate_limit)
+    return _get_or_create('github_graphql', create)
+
+
+def get_bedrock_runtime():
+    def create():
+        import boto3
+        return boto3.client('bedrock-runtime', region_name=config.BEDROCK_REGION)
+    return _get_or_create('bedrock_runtime', create)
+
+
+def get_llm(model_id, temperature, max_tokens):
+    """
+    모델 설정별 ChatBedrock 인스턴스를 반환합니다. 같은 설정이면 같은 인스턴스를 공유합니다.
+    override('llm', client)로 교체하면 모든 모델 설정에 그 클라이언트를 사용합니다.
+    """
+    overridden = _clients.get('llm')
+    if overridden is not None:
+        return overridden
+
+    def create():
+        from langchain_aws import ChatBedrock
+        return ChatBedrock(
+            model_id=model_id,
+            client=get_bedrock_runtime(),
+            model_kwargs={
+                "temperature": temperature,  # 다양성 설정
+                "max_tokens": max_tokens  # 최대 토큰 수 설정
+            }
+        )
+    return _get_or_create(('llm', model_id, temperature, max_tokens), create)
+
+
+def get_llm_cache():
+    def create():
+        from llm_cache import LLMCache
+        return LLMCache(
+            config.LLM_CACHE_PATH,
+            ttl=config.LLM_CACHE_TTL,
+            max_entries=config.LLM_CACHE_MAX_ENTRIES,
+        )
+    return _get_or_create('llm_cache', create)
+
+
+def get_text_store():
+    def create():
+        from text_store import TextStore
+        return TextStore(
+            config.TEXT_STORE_PATH,
+            max_entries=config.TEXT_STORE_MAX_ENTRIES,
+            memory_bytes=config.TEXT_STORE_MEMORY_BYTES,
+        )
+    return _get_or_create('text_store', create)
+
+
+def get_translation_memory():
+    def create():
+        from translation_memory import TranslationMemory
+        return TranslationMemory(config.TRANSLATION_MEMORY_PATH, max_entries=config.TRANSLATION_MEMORY_MAX_ENTRIES)
+    return _get_or_create('translation_memory', create)
+
+
+def get_s3():
+    def create():
+        import boto3
+        return boto3.client('s3', region_name=config.AWS_REGION)
+    return _get_or_create('s3', create)
+
+
+def get_job_queue():
+    def create():
+        from jobs import JobQueue
+        return JobQueue(
+            config.JOBS_DB_PATH,
+            max_workers=config.JOB_MAX_WORKERS,
+            max_pending=config.JOB_MAX_PENDING,
+        )
+    return _get_or_create('job_queue', create)
+
+
+def get_precomputed_index():
+    def create():
+        from precomputed import PrecomputedIndex
+        return PrecomputedIndex(config.PRECOMPUTED_INDEX_PATH, max_age=config.PRECOMPUTED_MAX_AGE)
+    return _get_or_create('precomputed_index', create)
+
+
+def get_rate_limiter(backend):
+    """
+    백엔드('bedrock', 'github', 'github_search')별로 프로세스 전체가 공유하는 요청 제한기를 반환합니다.
+    """
+    def create():
+        from rate_limit import AdaptiveRateLimiter, is_bedrock_throttle, is_github_throttle, github_retry_after
+
+        if backend == 'bedrock':
+            return AdaptiveRateLimiter(
+                backend,
+                rate=config.BEDROCK_RATE_LIMIT,
+                max_rate=config.BEDROCK_RATE_LIMIT,  # 할당량에서 시작해 스로틀링될 때만 줄임
+                max_concurrency=config.BEDROCK_MAX_CONCURRENCY,
+                burst=config.BEDROCK_BURST,
+                max_retries=config.RATE_LIMIT_MAX_RETRIES,
+                is_throttle=is_bedrock_throttle,
+            )
+        if backend in ('github', 'github_search'):
+            rate = config.GITHUB_SEARCH_RATE_LIMIT if backend == 'github_search' else config.GITHUB_RATE_LIMIT
+            return AdaptiveRateLimiter(
+                backend,
+                rate=rate,
+                max_rate=rate,  # GitHub 한도는 고정되어 있으므로 설정값 이상으로 올리지 않음
+                max_concurrency=config.GITHUB_MAX_CONCURRENCY,
+                max_retries=config.RATE_LIMIT_MAX_RETRIES,
+                is_throttle=is_github_throttle,
+                retry_after=github_retry_after,
+            )
+        raise ValueError(f"Unknown rate limiter backend: {backend}")
+    return _get_or_create(('rate_limiter', backend), create)
+
+
+def get_reranker():
+    def create():
+        from rerank import Reranker
+        return Reranker()
+    return _get_or_create('reranker', create)
@@ -8,4 +8,73 @@ load_dotenv()  # Take environment variables from .env.
 GITHUB_API_TOKEN = os.getenv('GITHUB_API_TOKEN')
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 AWS_REGION = os.getenv('AWS_REGION')
-S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME')
\ No newline at end of file
+S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME')
+BEDROCK_REGION = os.getenv('BEDROCK_REGION', 'us-east-1')
+
+# Local cache settings
+CACHE_DIR = os.getenv('CACHE_DIR', '.cache')
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(CACHE_DIR, 'llm_cache.sqlite3'))
+LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', str(7 * 24 * 3600)))  # 초 단위
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '5000'))
+GITHUB_CACHE_PATH = os.getenv('GITHUB_CACHE_PATH', os.path.join(CACHE_DIR, 'github_cache.sqlite3'))
+# 세션이 공유하는 README/요약/분석 텍스트 저장소
+TEXT_STORE_PATH = os.getenv('TEXT_STORE_PATH', os.path.join(CACHE_DIR, 'text_store.sqlite3'))
+TEXT_STORE_MAX_ENTRIES = int(os.getenv('TEXT_STORE_MAX_ENTRIES', '20000'))
+TEXT_STORE_MEMORY_BYTES = int(os.getenv('TEXT_STORE_MEMORY_BYTES', str(32 * 1024 * 1024)))
+# 문단 단위 번역 메모리
+TRANSLATION_MEMORY_PATH = os.getenv('TRANSLATION_MEMORY_PATH', os.path.join(CACHE_DIR, 'translation_memory.sqlite3'))
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv('TRANSLATION_MEMORY_MAX_ENTRIES', '50000'))
+# GraphQL로 검색 결과와 README를 한 번에 가져옴 (토큰이 필요하며, 실패하면 REST로 대체)
+GITHUB_GRAPHQL_ENABLED = os.getenv('GITHUB_GRAPHQL_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+# Background job settings
+JOBS_DB_PATH = os.getenv('JOBS_DB_PATH', os.path.join(CACHE_DIR, 'jobs.sqlite3'))
+JOB_MAX_WORKERS = int(os.getenv('JOB_MAX_WORKERS', '4'))  # 프로세스당 동시에 실행되는 작업 수
+JOB_MAX_PENDING = int(os.getenv('JOB_MAX_PENDING', '32'))  # 프로세스당 대기 및 실행 중인 작업의 최대 수
+JOB_POLL_INTERVAL = float(os.getenv('JOB_POLL_INTERVAL', '1.0'))  # UI가 작업 상태를 확인하는 간격(초)
+
+# Precomputed index settings (warm.py)
+PRECOMPUTED_INDEX_PATH = os.getenv('PRECOMPUTED_INDEX_PATH', os.path.join(CACHE_DIR, 'precomputed.sqlite3'))
+PRECOMPUTED_MAX_AGE = int(os.getenv('PRECOMPUTED_MAX_AGE', str(24 * 3600)))  # 초 단위
+
+# Metrics endpoint (0이면 비활성화)
+METRICS_PORT = int(os.getenv('METRICS_PORT', '0'))
+# 지표 이벤트(JSON 한 줄씩)를 기록할 파일 (비워 두면 표준 에러로 출력)
+METRICS_LOG_PATH = os.getenv('METRICS_LOG_PATH', 'metrics.log')
+
+# Rate limiting (초당 요청 수와 동시 요청 수, 스로틀링 시 자동으로 조정됨)
+# Bedrock은 계정 할당량(분당 요청 수 / 60)으로 시작하고, 스로틀링되면 줄였다가 이 값까지만 회복
+BEDROCK_RATE_LIMIT = float(os.getenv('BEDROCK_RATE_LIMIT', '10'))
+BEDROCK_MAX_CONCURRENCY = int(os.getenv('BEDROCK_MAX_CONCURRENCY', '16'))
+# 한꺼번에 보낼 수 있는 요청 수 (추천 목록 요약과 청크 요약이 동시에 나가는 수보다 크게 설정)
+BEDROCK_BURST = float(os.getenv('BEDROCK_BURST', str(BEDROCK_MAX_CONCURRENCY)))
+GITHUB_RATE_LIMIT = float(os.getenv('GITHUB_RATE_LIMIT', '5'))
+GITHUB_SEARCH_RATE_LIMIT = float(os.getenv('GITHUB_SEARCH_RATE_LIMIT', '0.5'))  # 검색 API는 분당 30회
+GITHUB_MAX_CONCURRENCY = int(os.getenv('GITHUB_MAX_CONCURRENCY', '8'))
+RATE_LIMIT_MAX_RETRIES = int(os.getenv('RATE_LIMIT_MAX_RETRIES', '5'))
+
+# LLM model routing
+# 작업별로 모델, temperature, max_tokens를 정하고, 호출이 실패하면 fallbacks의 모델을 순서대로 시도합니다.
+# LLM_<TASK>_MODEL, LLM_<TASK>_TEMPERATURE, LLM_<TASK>_MAX_TOKENS, LLM_<TASK>_FALLBACKS(쉼표 구분)로 작업별 값을 바꿀 수 있습니다.
+LLM_DEFAULT_MODEL = os.getenv('LLM_DEFAULT_MODEL', 'anthropic.claude-3-5-sonnet-20240620-v1:0')
+LLM_FAST_MODEL = os.getenv('LLM_FAST_MODEL', 'anthropic.claude-3-haiku-20240307-v1:0')
+
+
+def _llm_route(task, model_id, temperature, max_tokens, fallbacks):
+    prefix = f"LLM_{task.upper()}_"
+    return {
+        'model_id': os.getenv(prefix + 'MODEL', model_id),
+        'temperature': float(os.getenv(prefix + 'TEMPERATURE', str(temperature))),
+        'max_tokens': int(os.getenv(prefix + 'MAX_TOKENS', str(max_tokens))),
+        'fallbacks': [m.strip() for m in os.getenv(prefix + 'FALLBACKS', ','.join(fallbacks)).split(',') if m.strip()],
+    }
+
+
+LLM_ROUTES = {
+    # 짧은 요약과 번역은 빠른 모델로 처리하고, 분석과 가이드라인 작성만 큰 모델을 사용
+    'description_summary': _llm_route('description_summary', LLM_FAST_MODEL, 0.3, 200, [LLM_DEFAULT_MODEL]),
+    'readme_summary': _llm_route('readme_summary', LLM_FAST_MODEL, 0.3, 1000, [LLM_DEFAULT_MODEL]),
+    'culture_analysis': _llm_route('culture_analysis', LLM_DEFAULT_MODEL, 0.7, 1000, [LLM_FAST_MODEL]),
+    'guidelines': _llm_route('guidelines', LLM_DEFAULT_MODEL, 0.7, 1000, [LLM_FAST_MODEL]),
+    'translation': _llm_route('translation', LLM_FAST_MODEL, 0.2, 2000, [LLM_DEFAULT_MODEL]),
+}
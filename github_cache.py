@@ -0,0 +1,251 @@
+# github_cache.py
+
+import hashlib
+import json
+import threading
+import time
+
+import metrics
+from sqlite_store import SQLiteStore
+
+
+class GitHubHttpCache(SQLiteStore):
+    """
+    GitHub REST 응답을 ETag / Last-Modified와 함께 SQLite 파일에 저장하는 캐시입니다.
+
+    같은 파일을 사용하는 모든 세션과 프로세스가 캐시를 공유합니다.
+    응답과 blob은 각각 max_entries개까지 가장 오래 사용되지 않은 항목부터 삭제하며 보관합니다.
+    응답 헤더에서 읽은 리소스별 남은 요청 수(rate limit)도 함께 기록합니다.
+    """
+
+    def __init__(self, path, max_entries=20000):
+        self.max_entries = max_entries
+        super().__init__(path, (
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                accessed_at REAL NOT NULL DEFAULT 0
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                resource TEXT PRIMARY KEY,
+                remaining INTEGER NOT NULL,
+                rate_limit INTEGER NOT NULL,
+                reset REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """,
+        ))
+        with self._connect() as conn:
+            # 사용 시각 열이 없던 이전 파일에도 열을 추가
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(blobs)")]
+            if "accessed_at" not in columns:
+                conn.execute("ALTER TABLE blobs ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_blobs_accessed ON blobs (accessed_at)")
+
+    @staticmethod
+    def make_key(url, headers):
+        """
+        URL과 인증 헤더로 캐시 키를 만듭니다. 토큰이 다르면 응답을 공유하지 않습니다.
+        """
+        auth = headers.get("Authorization", "")
+        return hashlib.sha256(f"{auth}\n{url}".encode("utf-8")).hexdigest()
+
+    def lookup(self, key):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "etag": row[0],
+            "last_modified": row[1],
+            "headers": json.loads(row[2]),
+            "body": row[3],
+        }
+
+    def store(self, key, etag, last_modified, headers, body):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, headers, body, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, json.dumps(headers), body, now),
+            )
+            self._trim(conn, "responses", "key", "stored_at", self.max_entries)
+
+    def touch(self, key):
+        with self._connect() as conn:
+            conn.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+
+    def get_blob(self, sha):
+        """
+        Git blob SHA로 저장된 텍스트(README 등)를 반환합니다.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT content FROM blobs WHERE sha = ?", (sha,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE blobs SET accessed_at = ? WHERE sha = ?", (time.time(), sha))
+        return row[0] if row is not None else None
+
+    def put_blob(self, sha, content):
+        """
+        blob 텍스트를 저장하고 max_entries를 넘은 만큼 가장 오래 사용되지 않은 blob을 삭제합니다.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO blobs (sha, content, accessed_at) VALUES (?, ?, ?)",
+                (sha, content, time.time()),
+            )
+            self._trim(conn, "blobs", "sha", "accessed_at", self.max_entries)
+
+    def record_rate_limit(self, headers):
+        """
+        응답 헤더의 X-RateLimit-* 값을 리소스(core, search 등)별로 기록합니다.
+        """
+        headers = {k.lower(): v for k, v in headers.items()}
+        if "x-ratelimit-remaining" not in headers:
+            return
+        resource = headers.get("x-ratelimit-resource", "core")
+        metrics.registry.set_gauge("github_rate_limit_remaining", int(headers["x-ratelimit-remaining"]), resource=resource)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (resource, remaining, rate_limit, reset, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    resource,
+                    int(headers["x-ratelimit-remaining"]),
+                    int(headers.get("x-ratelimit-limit", 0)),
+                    float(headers.get("x-ratelimit-reset", 0)),
+                    time.time(),
+                ),
+            )
+
+    def rate_limit(self, resource):
+        """
+        마지막으로 관측한 리소스별 rate limit을 반환합니다. 리셋 시각이 지났으면 None을 반환합니다.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT remaining, rate_limit, reset FROM rate_limits WHERE resource = ?", (resource,)
+            ).fetchone()
+        if row is None or row[2] <= time.time():
+            return None
+        return {"remaining": row[0], "limit": row[1], "reset": row[2]}
+
+
+class _Response:
+    # PyGithub이 사용하는 httplib 응답 객체 인터페이스를 흉내냄
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.text = body
+
+    def getheaders(self):
+        return self.headers.items()
+
+    def read(self):
+        return self.text
+
+
+def _resource_for(url):
+    return "search" if "/search/" in url else "core"
+
+
+def _make_connection_class(base, cache):
+    class ConditionalConnection(base):
+        """
+        GET 요청에 If-None-Match / If-Modified-Since를 붙여 재검증하는 연결 클래스입니다.
+        304 응답은 GitHub rate limit에 포함되지 않으며, 캐시된 본문을 200 응답으로 돌려줍니다.
+        """
+
+        _sessions = threading.local()
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # 요청마다 연결 객체가 새로 만들어지므로 스레드별 세션을 재사용해 keep-alive 유지
+            session = getattr(self._sessions, "session", None)
+            if session is None:
+                self._sessions.session = self.session
+            else:
+                self.session = session
+
+        def close(self):
+            # 공유 세션은 닫지 않음
+            pass
+
+        def getresponse(self):
+            headers = dict(self.headers or {})
+            # PyGithub이 직접 조건부 요청을 보내는 경우에는 개입하지 않음
+            if self.verb.upper() != "GET" or "If-None-Match" in headers or "If-Modified-Since" in headers:
+                response = super().getresponse()
+                cache.record_rate_limit(dict(response.getheaders()))
+                return response
+
+            url = f"{self.protocol}://{self.host}:{self.port}{self.url}"
+            key = cache.make_key(url, headers)
+            cached = cache.lookup(key)
+
+            if cached is not None:
+                # 남은 요청이 없으면 네트워크를 타지 않고 캐시된 응답으로 대체
+                budget = cache.rate_limit(_resource_for(self.url))
+                if budget is not None and budget["remaining"] <= 0:
+                    metrics.record_cache('github', 'stale')
+                    return _Response(200, cached["headers"], cached["body"])
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                elif cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            r = self.session.get(
+                url,
+                headers=headers,
+                timeout=self.timeout,
+                verify=self.verify,
+                allow_redirects=False,
+            )
+            cache.record_rate_limit(r.headers)
+
+            if r.status_code == 304 and cached is not None:
+                metrics.record_cache('github', 'revalidated')
+                cache.touch(key)
+                response_headers = dict(cached["headers"])
+                response_headers.update(r.headers)
+                return _Response(200, response_headers, cached["body"])
+
+            metrics.record_cache('github', 'miss')
+            if r.status_code == 200:
+                etag = r.headers.get("ETag")
+                last_modified = r.headers.get("Last-Modified")
+                if etag or last_modified:
+                    cache.store(key, etag, last_modified, dict(r.headers), r.text)
+
+            return _Response(r.status_code, r.headers, r.text)
+
+    return ConditionalConnection
+
+
+def install_conditional_cache(cache):
+    """
+    이후 생성되는 PyGithub 클라이언트가 조건부 요청 캐시를 사용하도록 연결 클래스를 교체합니다.
+    Github 객체를 만들기 전에 호출해야 합니다.
+    """
+    from github.Requester import HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass, Requester
+
+    Requester.injectConnectionClasses(
+        _make_connection_class(HTTPRequestsConnectionClass, cache),
+        _make_connection_class(HTTPSRequestsConnectionClass, cache),
+    )
@@ -0,0 +1,156 @@
+# github_graphql.py
+
+import threading
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+GRAPHQL_TIMEOUT = 15  # GraphQL 요청 하나에 허용하는 최대 시간(초)
+
+# GraphQL에는 REST의 /readme처럼 README를 찾아주는 필드가 없으므로 흔한 파일 이름을 별칭으로 함께 조회
+README_PATHS = ('README.md', 'readme.md', 'Readme.md', 'README.rst', 'README.txt', 'README')
+
+_BLOB_FIELDS = "... on Blob { oid text isTruncated }"
+
+_README_FIELDS = "\n".join(
+    f'        readme{i}: object(expression: "HEAD:{path}") {{ {_BLOB_FIELDS} }}'
+    for i, path in enumerate(README_PATHS)
+)
+
+# 순위를 매길 후보는 많으므로 검색에서는 가벼운 메타데이터만 가져옴
+SEARCH_QUERY = """
+query($query: String!, $first: Int!) {
+  search(query: $query, type: REPOSITORY, first: $first) {
+    nodes {
+      ... on Repository {
+        id
+        nameWithOwner
+        description
+        url
+        forkCount
+        stargazerCount
+        primaryLanguage { name }
+        repositoryTopics(first: 10) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+
+README_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on Repository {
+      id
+%s
+    }
+  }
+}
+""" % _README_FIELDS
+
+
+class GraphQLError(Exception):
+    """
+    GraphQL 요청이 실패했을 때 발생합니다.
+    status, data, headers는 REST 오류(GithubException)와 같은 이름이므로 스로틀링 판별에 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, message, status=None, data=None, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+
+
+class GraphQLRepository:
+    """
+    GraphQL 검색 결과 한 건입니다. 추천 목록을 만들 때 사용하는 PyGithub Repository 속성과 같은 이름을 가지며,
+    fetch_readmes로 README를 찾았으면 readme_text와 readme_sha(blob SHA)에 내용이 들어 있습니다.
+    """
+
+    __slots__ = ('node_id', 'full_name', 'description', 'html_url', 'forks_count', 'stargazers_count',
+                 'language', 'topics', 'readme_text', 'readme_sha')
+
+    def __init__(self, node):
+        self.node_id = node.get('id')
+        self.full_name = node['nameWithOwner']
+        self.description = node.get('description')
+        self.html_url = node['url']
+        self.forks_count = node.get('forkCount', 0)
+        self.stargazers_count = node.get('stargazerCount', 0)
+        self.language = (node.get('primaryLanguage') or {}).get('name')
+        self.topics = [
+            topic['topic']['name'] for topic in (node.get('repositoryTopics') or {}).get('nodes', []) if topic
+        ]
+        self.readme_text = None
+        self.readme_sha = None
+        self.set_readme(node)
+
+    def set_readme(self, node):
+        for i in range(len(README_PATHS)):
+            blob = node.get(f'readme{i}')
+            # 바이너리이거나 너무 커서 잘린 README는 REST로 다시 가져오도록 비워 둠
+            if blob and blob.get('text') is not None and not blob.get('isTruncated'):
+                self.readme_text = blob['text']
+                self.readme_sha = blob['oid']
+                break
+
+
+class GitHubGraphQL:
+    """
+    GitHub GraphQL API 클라이언트입니다. 검색 결과와 메타데이터, 선택한 리포지토리들의 README 본문을 각각 한 번의 요청으로 가져옵니다.
+    """
+
+    def __init__(self, token, url=GRAPHQL_URL, timeout=GRAPHQL_TIMEOUT, on_response=None):
+        self.token = token
+        self.url = url
+        self.timeout = timeout
+        # 응답 헤더(X-RateLimit-*)를 받을 콜백
+        self.on_response = on_response
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            import requests
+
+            session = self._local.session = requests.Session()
+            session.headers['Authorization'] = f"bearer {self.token}"
+        return session
+
+    def execute(self, query, variables):
+        response = self._session().post(
+            self.url, json={'query': query, 'variables': variables}, timeout=self.timeout
+        )
+        if self.on_response is not None:
+            self.on_response(response.headers)
+        if response.status_code != 200:
+            raise GraphQLError(
+                f"GraphQL request failed with status {response.status_code}",
+                status=response.status_code,
+                data=response.text,
+                headers=dict(response.headers),
+            )
+        payload = response.json()
+        if payload.get('errors') and not payload.get('data'):
+            messages = "; ".join(error.get('message', '') for error in payload['errors'])
+            raise GraphQLError(messages, status=response.status_code, data=payload, headers=dict(response.headers))
+        return payload['data']
+
+    def search_repositories(self, query, first):
+        """
+        별(star) 순으로 상위 first개(최대 100개)의 리포지토리를 README 없이 GraphQLRepository 목록으로 반환합니다.
+        """
+        data = self.execute(SEARCH_QUERY, {'query': f"{query} sort:stars-desc", 'first': first})
+        # 접근 권한이 없는 결과는 빈 노드로 올 수 있음
+        return [GraphQLRepository(node) for node in data['search']['nodes'] if node]
+
+    def fetch_readmes(self, repos):
+        """
+        여러 리포지토리의 README를 한 번의 요청으로 가져와 각 객체에 채웁니다.
+        """
+        by_id = {repo.node_id: repo for repo in repos if repo.node_id}
+        if not by_id:
+            return
+        data = self.execute(README_QUERY, {'ids': list(by_id)})
+        for node in data['nodes']:
+            if node and node.get('id') in by_id:
+                by_id[node['id']].set_readme(node)
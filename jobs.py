@@ -0,0 +1,170 @@
+# jobs.py
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlite_store import SQLiteStore
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 너무 많아 새 작업을 받을 수 없을 때 발생합니다."""
+
+
+class JobQueue(SQLiteStore):
+    """
+    분석과 PDF 내보내기 같은 오래 걸리는 작업을 백그라운드 스레드에서 실행하는 작업 큐입니다.
+
+    작업 상태, 진행 중인 부분 결과, 최종 결과는 SQLite 파일에 저장되므로
+    Streamlit 스크립트가 다시 실행되거나 다른 탭에서 접속해도 작업 ID로 결과를 가져올 수 있습니다.
+    동시에 실행되는 작업 수는 프로세스당 max_workers개로 제한됩니다.
+    """
+
+    def __init__(self, path, max_workers=4, max_pending=32, result_ttl=24 * 3600,
+                 stale_after=600, progress_interval=0.5):
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.stale_after = stale_after
+        self.progress_interval = progress_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._pending = 0
+        super().__init__(path, (
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """,
+        ))
+
+    @staticmethod
+    def make_job_id(kind, key):
+        """
+        작업 종류와 입력으로 결정되는 작업 ID를 만듭니다. 같은 입력의 작업은 같은 ID를 공유합니다.
+        """
+        payload = json.dumps([kind, key], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+    def submit(self, kind, func, *args, key=None):
+        """
+        func(report, *args)를 백그라운드에서 실행하고 작업 ID를 반환합니다.
+
+        report(dict)는 진행 중인 부분 결과를 저장하는 콜백이며, func의 반환값은 JSON으로 저장됩니다.
+        key가 주어지고 같은 key의 작업이 진행 중이거나 완료되어 있으면 새로 실행하지 않고 그 ID를 반환합니다.
+        """
+        self._purge_expired()
+        job_id = self.make_job_id(kind, key) if key is not None else uuid.uuid4().hex
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"Too many pending jobs ({self._pending}).")
+            self._pending += 1
+
+        now = time.time()
+        with self._connect() as conn:
+            # 같은 ID의 작업이 실패했거나 응답이 없을 때만 덮어써서, 동시에 제출해도 한 번만 실행되도록 함
+            claimed = conn.execute(
+                """
+                INSERT INTO jobs (id, kind, status, progress, result, error, created_at, updated_at)
+                VALUES (?, ?, ?, ?, NULL, NULL, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    status = excluded.status, progress = excluded.progress, result = NULL, error = NULL,
+                    created_at = excluded.created_at, updated_at = excluded.updated_at
+                WHERE jobs.status = ? OR (jobs.status IN (?, ?) AND jobs.updated_at < ?)
+                """,
+                (job_id, kind, QUEUED, json.dumps({}), now, now, FAILED, QUEUED, RUNNING, now - self.stale_after),
+            ).rowcount
+
+        if not claimed:
+            with self._lock:
+                self._pending -= 1
+            return job_id
+
+        self._executor.submit(self._run, job_id, kind, func, args)
+        logging.info(f"Job {job_id} ({kind}) queued.")
+        return job_id
+
+    def get(self, job_id):
+        """
+        작업 상태를 딕셔너리로 반환합니다. 없는 작업이면 None을 반환합니다.
+        오랫동안 갱신되지 않은 실행 중 작업(프로세스 종료 등)은 실패로 간주합니다.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, kind, status, progress, result, error, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        job = {
+            'id': row[0],
+            'kind': row[1],
+            'status': row[2],
+            'progress': json.loads(row[3]),
+            'result': json.loads(row[4]) if row[4] is not None else None,
+            'error': row[5],
+            'created_at': row[6],
+            'updated_at': row[7],
+        }
+        if job['status'] in (QUEUED, RUNNING) and time.time() - job['updated_at'] > self.stale_after:
+            job['status'] = FAILED
+            job['error'] = "Job stopped responding."
+        return job
+
+    def _update(self, job_id, **fields):
+        fields['updated_at'] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def _run(self, job_id, kind, func, args):
+        progress = {}
+        last_write = [0.0]
+        report_lock = threading.Lock()
+
+        def report(update, force=False):
+            # 진행 상황은 자주 바뀌므로 progress_interval마다 한 번만 저장
+            with report_lock:
+                progress.update(update)
+                now = time.monotonic()
+                if force or now - last_write[0] >= self.progress_interval:
+                    last_write[0] = now
+                    self._update(job_id, progress=json.dumps(progress, ensure_ascii=False))
+
+        started = time.perf_counter()
+        try:
+            self._update(job_id, status=RUNNING)
+            result = func(report, *args)
+            report({}, force=True)
+            self._update(job_id, status=DONE, result=json.dumps(result, ensure_ascii=False))
+            logging.info(f"Job {job_id} ({kind}) finished in {time.perf_counter() - started:.2f}s.")
+        except Exception as e:
+            logging.error(f"Job {job_id} ({kind}) failed: {e}")
+            self._update(job_id, status=FAILED, error=str(e))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _purge_expired(self):
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (DONE, FAILED, time.time() - self.result_ttl),
+            )
@@ -0,0 +1,109 @@
+# llm_cache.py
+
+import hashlib
+import json
+import threading
+import time
+
+from sqlite_store import SQLiteStore
+
+
+class LLMCache(SQLiteStore):
+    """
+    LLM 응답을 SQLite 파일에 저장하는 공유 캐시입니다.
+
+    키는 모델 ID, temperature, max_tokens, 렌더링된 프롬프트의 해시이며,
+    같은 파일을 사용하는 모든 세션과 프로세스가 캐시를 공유합니다.
+    항목은 ttl(초)이 지나면 만료되고, max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제됩니다.
+    """
+
+    def __init__(self, path, ttl=7 * 24 * 3600, max_entries=5000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        super().__init__(path, (
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)",
+        ))
+
+    @staticmethod
+    def make_key(model_id, temperature, max_tokens, prompt):
+        """
+        모델 설정과 프롬프트로 캐시 키(SHA-256)를 만듭니다.
+        """
+        payload = json.dumps(
+            {
+                "model_id": model_id,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key, *alternates):
+        """
+        캐시된 응답을 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        alternates를 주면 key가 없을 때 그 키들을 순서대로 확인합니다(조회는 한 번으로 셉니다).
+        """
+        keys = (key,) + alternates
+        now = time.time()
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT key, response, created_at FROM llm_cache WHERE key IN ({','.join('?' * len(keys))})", keys
+            ).fetchall()
+            found = {}
+            for row_key, response, created_at in rows:
+                if now - created_at > self.ttl:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (row_key,))
+                else:
+                    found[row_key] = response
+            hit_key = next((k for k in keys if k in found), None)
+            if hit_key is not None:
+                conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, hit_key))
+
+        with self._lock:
+            if hit_key is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return found[hit_key] if hit_key is not None else None
+
+    def set(self, key, response):
+        """
+        응답을 저장하고 최대 항목 수를 넘은 만큼 오래된 항목을 삭제합니다.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+            self._trim(conn, "llm_cache", "key", "accessed_at", self.max_entries)
+
+    def stats(self):
+        """
+        이 프로세스에서의 적중/미스 횟수와 저장된 항목 수를 반환합니다.
+        """
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": entries,
+            }
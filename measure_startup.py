@@ -0,0 +1,97 @@
+# measure_startup.py
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+# 지연 로딩 이전의 utils/app이 시작 시점에 import하던 라이브러리와 클라이언트 생성
+EAGER_STARTUP = """
+import boto3, pdfkit, jinja2
+from github import Github
+from langchain_aws import ChatBedrock
+from langchain_core.prompts import PromptTemplate
+import tiktoken
+import config
+Github(config.GITHUB_API_TOKEN)
+ChatBedrock(model_id="anthropic.claude-3-5-sonnet-20240620-v1:0",
+            client=boto3.client('bedrock-runtime', region_name='us-east-1'))
+boto3.client('s3', region_name=config.AWS_REGION)
+"""
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def app_startup_code(path=APP_PATH):
+    """
+    app.py가 시작 시점에 실행하는 import와 최상위 클라이언트 생성(clients.get_*() 호출)을 코드로 만듭니다.
+    app.py를 고쳐도 측정 대상이 따라가도록 파일에서 직접 읽으며,
+    이전 측정과 같은 조건이 되도록 streamlit import는 제외합니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    lines = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias for alias in node.names if alias.name.split(".")[0] != "streamlit"]
+            if names:
+                lines.append(ast.unparse(ast.Import(names=names)))
+        elif isinstance(node, ast.ImportFrom):
+            if (node.module or "").split(".")[0] != "streamlit":
+                lines.append(ast.unparse(node))
+        elif isinstance(node, (ast.Assign, ast.Expr)) and _is_client_call(node.value):
+            lines.append(ast.unparse(node))
+    return "\n".join(lines)
+
+
+def _is_client_call(node):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "clients"
+        and node.func.attr.startswith("get_")
+    )
+
+
+def measure(code, runs):
+    """
+    새 인터프리터에서 code를 실행하는 데 걸린 시간(초)을 runs번 측정합니다.
+    인터프리터 자체의 기동 시간은 포함하지 않습니다.
+    """
+    def run_once(snippet):
+        timer = (
+            "import time; _start = time.perf_counter()\n"
+            f"{snippet}\n"
+            "print(time.perf_counter() - _start)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", timer], capture_output=True, text=True, check=True
+        ).stdout
+        return float(output.strip().splitlines()[-1])
+
+    return [run_once(code) for _ in range(runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the app modules.")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters per mode")
+    args = parser.parse_args()
+
+    for label, code in (("eager (previous)", EAGER_STARTUP), ("lazy (current)", app_startup_code())):
+        try:
+            timings = measure(code, args.runs)
+        except subprocess.CalledProcessError as e:
+            print(f"{label:>18}: failed ({e.stderr.strip().splitlines()[-1]})")
+            continue
+        print(
+            f"{label:>18}: median {statistics.median(timings) * 1000:.0f} ms, "
+            f"min {min(timings) * 1000:.0f} ms over {args.runs} runs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# metrics.py
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import config
+
+# 외부 호출 지연 시간 히스토그램의 버킷 경계(초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _create_logger():
+    # 지표 이벤트는 JSON 한 줄만 남도록 전용 핸들러에 메시지만 쓰고, 앱 로그(루트 핸들러)로는 전달하지 않음
+    logger = logging.getLogger("metrics")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        if config.METRICS_LOG_PATH:
+            # 첫 이벤트를 기록할 때 파일을 엶
+            handler = logging.FileHandler(config.METRICS_LOG_PATH, delay=True)
+        else:
+            handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+_logger = _create_logger()
+
+
+class MetricsRegistry:
+    """
+    카운터, 게이지, 히스토그램을 프로세스 안에서 모으고 Prometheus 텍스트 형식으로 내보내는 저장소입니다.
+    각 지표는 이름과 라벨 조합별로 따로 집계됩니다.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._help = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def describe(self, name, help_text):
+        self._help[name] = help_text
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram['buckets'][i] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def snapshot(self):
+        """
+        현재 값을 복사해 (카운터, 게이지, 히스토그램) 딕셔너리로 반환합니다.
+        """
+        with self._lock:
+            return (
+                dict(self._counters),
+                dict(self._gauges),
+                {key: {'buckets': list(h['buckets']), 'sum': h['sum'], 'count': h['count']}
+                 for key, h in self._histograms.items()},
+            )
+
+    def render_prometheus(self):
+        """
+        Prometheus 텍스트 노출 형식(text/plain; version=0.0.4)으로 모든 지표를 반환합니다.
+        """
+        counters, gauges, histograms = self.snapshot()
+        lines = []
+
+        def format_labels(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+        def header(name, kind, seen):
+            if name in seen:
+                return
+            seen.add(name)
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        seen = set()
+        for (name, labels), value in sorted(counters.items()):
+            header(name, "counter", seen)
+            lines.append(f"{name}{format_labels(labels)} {value}")
+        for (name, labels), value in sorted(gauges.items()):
+            header(name, "gauge", seen)
+            lines.append(f"{name}{format_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(histograms.items()):
+            header(name, "histogram", seen)
+            for bound, count in zip(self.buckets, histogram['buckets']):
+                lines.append(f"{name}_bucket{format_labels(labels, [('le', str(bound))])} {count}")
+            lines.append(f"{name}_bucket{format_labels(labels, [('le', '+Inf')])} {histogram['count']}")
+            lines.append(f"{name}_sum{format_labels(labels)} {histogram['sum']}")
+            lines.append(f"{name}_count{format_labels(labels)} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+registry.describe("span_duration_seconds", "Latency of instrumented operations.")
+registry.describe("span_errors_total", "Instrumented operations that raised an exception.")
+registry.describe("llm_input_tokens_total", "Prompt tokens sent to the LLM (cl100k_base estimate).")
+registry.describe("llm_output_tokens_total", "Completion tokens received from the LLM (cl100k_base estimate).")
+registry.describe("llm_time_to_first_token_seconds", "Time until the first streamed LLM chunk.")
+registry.describe("llm_fallbacks_total", "LLM calls that failed on a model and moved to the next model in the route.")
+registry.describe("cache_requests_total", "Cache lookups by cache and result.")
+registry.describe("translation_skipped_total", "Translations skipped because the text was already in the target language.")
+registry.describe("github_rate_limit_remaining", "Remaining GitHub API requests in the current window.")
+registry.describe("rate_limiter_rate", "Current request rate allowed by the adaptive rate limiter (req/s).")
+registry.describe("rate_limiter_throttles_total", "Throttled responses that triggered a back-off and retry.")
+registry.describe("singleflight_shared_total", "Calls that joined an identical in-flight call instead of issuing their own.")
+
+
+def log_event(event, **fields):
+    """
+    구조화된 지표 이벤트를 JSON 한 줄로 기록합니다.
+    """
+    _logger.info(json.dumps({"event": event, "ts": round(time.time(), 3), **fields}, ensure_ascii=False))
+
+
+@contextmanager
+def timed(span, **labels):
+    """
+    블록 실행 시간을 span_duration_seconds 히스토그램에 기록하고 JSON 로그 한 줄을 남깁니다.
+    예외가 발생하면 span_errors_total도 증가시킨 뒤 예외를 그대로 전달합니다.
+    """
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        registry.inc("span_errors_total", span=span, **labels)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        registry.observe("span_duration_seconds", elapsed, span=span, **labels)
+        log_event("span", span=span, status=status, duration_ms=round(elapsed * 1000, 1), **labels)
+
+
+def record_tokens(task, input_tokens, output_tokens):
+    registry.inc("llm_input_tokens_total", input_tokens, task=task)
+    registry.inc("llm_output_tokens_total", output_tokens, task=task)
+
+
+def record_cache(cache, result):
+    registry.inc("cache_requests_total", cache=cache, result=result)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 수집기의 주기적인 요청으로 로그가 넘치지 않도록 접근 로그는 남기지 않음
+        pass
+
+
+_server = None
+_server_started = False
+_server_lock = threading.Lock()
+
+
+def start_http_server(port, host="0.0.0.0"):
+    """
+    /metrics 경로로 Prometheus 형식 지표를 제공하는 HTTP 서버를 백그라운드 스레드에서 시작합니다.
+    프로세스당 한 번만 시도하며, 이후 호출은 처음 만든 서버(실패했으면 None)를 반환합니다.
+    """
+    global _server, _server_started
+    with _server_lock:
+        if _server_started:
+            return _server
+        _server_started = True
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            # 같은 호스트의 다른 워커가 이미 포트를 사용 중인 경우
+            logging.warning(f"Metrics endpoint not started on port {port}: {e}")
+            return None
+        threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        logging.info(f"Metrics endpoint listening on http://{host}:{port}/metrics")
+        return _server
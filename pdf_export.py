@@ -0,0 +1,111 @@
+# pdf_export.py
+
+import hashlib
+import io
+from functools import lru_cache
+
+import metrics
+
+PDF_TEMPLATE_PATH = 'templates/pdf_template.html'
+WKHTMLTOPDF_PATH = '/usr/bin/wkhtmltopdf'
+PDF_OPTIONS = {
+    'encoding': 'UTF-8',
+    'enable-local-file-access': None,
+}
+REPORT_KEY_PREFIX = 'reports/'  # S3에 저장되는 리포트의 키 접두사
+PRESIGNED_URL_EXPIRES = 3600  # 다운로드 링크 유효 시간(초)
+
+
+@lru_cache(maxsize=1)
+def _get_template():
+    # jinja2는 PDF를 만들 때만 필요하므로 처음 사용할 때 import
+    from jinja2 import Template
+
+    with open(PDF_TEMPLATE_PATH, encoding='utf-8') as f:
+        return Template(f.read())
+
+
+def render_report_html(projects):
+    """
+    분석된 프로젝트 목록을 PDF 템플릿으로 렌더링한 HTML 문자열을 반환합니다.
+    """
+    return _get_template().render(projects=projects)
+
+
+def render_pdf(html_content):
+    """
+    HTML을 디스크를 거치지 않고 메모리에서 PDF 바이트로 변환합니다.
+    """
+    import pdfkit
+
+    config_pdfkit = pdfkit.configuration(wkhtmltopdf=WKHTMLTOPDF_PATH)
+    # 출력 경로로 False를 넘기면 wkhtmltopdf의 stdout을 바이트로 돌려받음
+    with metrics.timed('pdf.render'):
+        return pdfkit.from_string(html_content, False, configuration=config_pdfkit, options=PDF_OPTIONS)
+
+
+def report_key(html_content):
+    """
+    렌더링된 HTML의 SHA-256으로 S3 키를 만듭니다. 같은 내용의 리포트는 같은 키를 가집니다.
+    """
+    digest = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+    return f"{REPORT_KEY_PREFIX}{digest}.pdf"
+
+
+def _object_exists(s3_client, bucket, key):
+    from botocore.exceptions import ClientError
+
+    with metrics.timed('s3.head_object'):
+        try:
+            s3_client.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+
+def upload_pdf_report(projects, s3_client, bucket):
+    """
+    프로젝트 리포트를 PDF로 만들어 S3에 올리고 (S3 키, 재사용 여부)를 반환합니다.
+
+    같은 내용의 리포트가 이미 S3에 있으면 다시 렌더링하거나 업로드하지 않습니다.
+    """
+    html_content = render_report_html(projects)
+    key = report_key(html_content)
+
+    reused = _object_exists(s3_client, bucket, key)
+    metrics.record_cache('pdf_report', 'hit' if reused else 'miss')
+    if not reused:
+        pdf_bytes = render_pdf(html_content)
+        # upload_fileobj는 큰 파일을 자동으로 멀티파트 업로드함
+        with metrics.timed('s3.upload'):
+            s3_client.upload_fileobj(
+                io.BytesIO(pdf_bytes),
+                bucket,
+                key,
+                ExtraArgs={'ContentType': 'application/pdf'},
+            )
+    return key, reused
+
+
+def report_url(s3_client, bucket, key):
+    """
+    리포트의 presigned 다운로드 URL을 발급합니다. 서명은 로컬에서 만들어지므로 S3 요청이 없습니다.
+    """
+    return s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=PRESIGNED_URL_EXPIRES,
+    )
+
+
+def export_pdf_report(projects, s3_client, bucket):
+    """
+    프로젝트 리포트를 PDF로 만들어 S3에 올리고 (다운로드 URL, 재사용 여부)를 반환합니다.
+
+    같은 내용의 리포트가 이미 S3에 있으면 다시 렌더링하거나 업로드하지 않고
+    새 presigned URL만 발급합니다.
+    """
+    key, reused = upload_pdf_report(projects, s3_client, bucket)
+    return report_url(s3_client, bucket, key), reused
@@ -0,0 +1,104 @@
+# pipeline.py
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class StagePipeline:
+    """
+    의존 관계가 있는 작업(stage)들을 스레드 풀에서 동시에 실행하는 작은 실행기입니다.
+
+    각 stage는 의존하는 stage가 모두 끝나는 즉시 시작되며,
+    의존 stage의 결과를 등록한 순서대로 위치 인자로 전달받습니다.
+    """
+
+    def __init__(self, max_workers=4, name="pipeline"):
+        self.max_workers = max_workers
+        self.name = name
+        self.timings = {}
+        self._stages = {}
+
+    def add(self, name, func, deps=()):
+        """
+        stage를 등록합니다. 의존 stage는 먼저 등록되어 있어야 하므로 순환이 생기지 않습니다.
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already registered.")
+        for dep in deps:
+            if dep not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'.")
+        self._stages[name] = (func, tuple(deps))
+        return self
+
+    def run(self, timeout=None):
+        """
+        모든 stage를 실행하고 {stage 이름: 결과} 딕셔너리를 반환합니다.
+        stage 하나라도 실패하면 그 예외를 다시 발생시킵니다.
+        """
+        return self.start().result(timeout=timeout)
+
+    def start(self):
+        """
+        stage 실행을 시작하고 전체 결과 딕셔너리를 담을 Future를 즉시 반환합니다.
+        """
+        done = Future()
+        if not self._stages:
+            done.set_result({})
+            return done
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        lock = threading.Lock()
+        results = {}
+        waiting = {name: len(deps) for name, (_, deps) in self._stages.items()}
+        dependents = {name: [] for name in self._stages}
+        for name, (_, deps) in self._stages.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        started_at = time.perf_counter()
+
+        def launch(name):
+            func, deps = self._stages[name]
+            args = [results[dep] for dep in deps]
+            executor.submit(run_stage, name, func, args)
+
+        def run_stage(name, func, args):
+            stage_started = time.perf_counter()
+            try:
+                value = func(*args)
+            except BaseException as e:
+                logging.error(f"[{self.name}] stage '{name}' failed after {time.perf_counter() - stage_started:.2f}s: {e}")
+                with lock:
+                    if not done.done():
+                        done.set_exception(e)
+                executor.shutdown(wait=False, cancel_futures=True)
+                return
+
+            elapsed = time.perf_counter() - stage_started
+            logging.info(f"[{self.name}] stage '{name}' finished in {elapsed:.2f}s")
+            with lock:
+                if done.done():
+                    return
+                results[name] = value
+                self.timings[name] = elapsed
+                ready = []
+                for dependent in dependents[name]:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        ready.append(dependent)
+                finished = len(results) == len(self._stages)
+                if finished:
+                    total = time.perf_counter() - started_at
+                    logging.info(f"[{self.name}] all {len(results)} stages finished in {total:.2f}s")
+                    done.set_result(dict(results))
+
+            if finished:
+                executor.shutdown(wait=False)
+            for dependent in ready:
+                launch(dependent)
+
+        roots = [name for name, count in waiting.items() if count == 0]
+        for name in roots:
+            launch(name)
+        return done
@@ -0,0 +1,111 @@
+# precomputed.py
+
+import json
+import re
+import time
+
+from sqlite_store import SQLiteStore
+
+# 미리 계산해 두는 결과 종류
+SUMMARY = 'summary'
+CULTURE_ANALYSIS = 'culture_analysis'
+GUIDELINES = 'guidelines'
+
+
+def normalize_terms(value):
+    """
+    쉼표나 공백으로 구분된 입력을 소문자, 중복 제거, 정렬된 형태로 정규화합니다.
+    """
+    terms = {term.lower() for term in re.split(r"[,\s]+", value or "") if term}
+    return " ".join(sorted(terms))
+
+
+def normalize_query(tech_stack, interest_areas):
+    return json.dumps([normalize_terms(tech_stack), normalize_terms(interest_areas)])
+
+
+def normalize_language(target_language):
+    return (target_language or "").strip().lower()
+
+
+class PrecomputedIndex(SQLiteStore):
+    """
+    warm.py가 미리 계산한 추천 목록과 요약/분석/번역 결과를 저장하는 로컬 인덱스입니다.
+
+    추천 목록은 정규화된 (기술 스택, 관심 분야)로, 나머지 결과는 (리포지토리, 종류, 언어)로 조회하며,
+    max_age(초)보다 오래된 항목은 없는 것으로 취급합니다.
+    """
+
+    def __init__(self, path, max_age=24 * 3600):
+        self.max_age = max_age
+        super().__init__(path, (
+            """
+            CREATE TABLE IF NOT EXISTS queries (
+                query TEXT PRIMARY KEY,
+                projects TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS artifacts (
+                repo TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                language TEXT NOT NULL,
+                value TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (repo, kind, language)
+            )
+            """,
+        ))
+
+    def get_projects(self, tech_stack, interest_areas):
+        """
+        미리 계산된 추천 프로젝트 목록을 반환합니다. 없거나 오래되었으면 None을 반환합니다.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT projects FROM queries WHERE query = ? AND updated_at >= ?",
+                (normalize_query(tech_stack, interest_areas), time.time() - self.max_age),
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put_projects(self, tech_stack, interest_areas, projects):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO queries (query, projects, updated_at) VALUES (?, ?, ?)",
+                (normalize_query(tech_stack, interest_areas), json.dumps(projects, ensure_ascii=False), time.time()),
+            )
+
+    def get_artifact(self, repo, kind, target_language=""):
+        """
+        미리 계산된 결과를 반환합니다. target_language가 비어 있으면 원문 결과를 조회합니다.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM artifacts WHERE repo = ? AND kind = ? AND language = ? AND updated_at >= ?",
+                (repo, kind, normalize_language(target_language), time.time() - self.max_age),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def put_artifact(self, repo, kind, value, target_language=""):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts (repo, kind, language, value, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (repo, kind, normalize_language(target_language), value, time.time()),
+            )
+
+    def get_analysis(self, repo, target_language=""):
+        """
+        세션 상태의 analyzed_projects 항목과 같은 형태로 분석 결과를 반환합니다.
+        필요한 결과가 하나라도 없으면 None을 반환합니다.
+        """
+        analysis = {
+            'culture_analysis': self.get_artifact(repo, CULTURE_ANALYSIS),
+            'guidelines': self.get_artifact(repo, GUIDELINES),
+        }
+        if target_language:
+            analysis['translated_culture_analysis'] = self.get_artifact(repo, CULTURE_ANALYSIS, target_language)
+            analysis['translated_guidelines'] = self.get_artifact(repo, GUIDELINES, target_language)
+        if any(value is None for value in analysis.values()):
+            return None
+        return analysis
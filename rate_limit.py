@@ -0,0 +1,163 @@
+# rate_limit.py
+
+import logging
+import random
+import threading
+import time
+
+import metrics
+
+
+class AdaptiveRateLimiter:
+    """
+    백엔드별 요청 속도와 동시 요청 수를 제한하고, 스로틀링 응답에는 재시도로 대응하는 제한기입니다.
+
+    - 토큰 버킷: 초당 rate개의 요청을 허용하며 최대 burst개(기본값은 rate와 max_concurrency 중 큰 값)까지 몰아서 보낼 수 있습니다.
+    - 동시성 제한: 동시에 진행 중인 요청은 max_concurrency개를 넘지 않습니다.
+    - AIMD: 요청이 성공하면 rate를 increase만큼 올리고, 스로틀링되면 decrease배로 줄입니다.
+    - 재시도: 스로틀링된 요청은 지터가 적용된 지수 백오프 후 최대 max_retries번 다시 시도합니다.
+    """
+
+    def __init__(self, name, rate, max_concurrency, burst=None, min_rate=0.1, max_rate=None,
+                 increase=0.05, decrease=0.5, max_retries=5, base_delay=0.5, max_delay=30.0,
+                 is_throttle=None, retry_after=None):
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.burst = burst if burst is not None else max(1.0, rate, max_concurrency)
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.is_throttle = is_throttle or (lambda e: False)
+        self.retry_after = retry_after or (lambda e: None)
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        metrics.registry.set_gauge("rate_limiter_rate", self.rate, backend=self.name)
+
+    def _acquire_token(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            rate = self.rate
+        metrics.registry.set_gauge("rate_limiter_rate", rate, backend=self.name)
+
+    def _on_throttle(self, attempt, error):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # 버킷에 남은 토큰도 비워 다른 스레드의 요청이 한꺼번에 몰리지 않도록 함
+            self._tokens = 0
+            rate = self.rate
+        metrics.registry.set_gauge("rate_limiter_rate", rate, backend=self.name)
+        metrics.registry.inc("rate_limiter_throttles_total", backend=self.name)
+
+        delay = self.retry_after(error)
+        if delay is None:
+            # full jitter 지수 백오프
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        logging.warning(
+            f"[{self.name}] throttled (attempt {attempt + 1}/{self.max_retries + 1}), "
+            f"rate lowered to {rate:.2f}/s, retrying in {delay:.2f}s: {error}"
+        )
+        time.sleep(delay)
+
+    def call(self, func, *args, **kwargs):
+        """
+        제한 안에서 func를 호출하고 결과를 반환합니다. 재시도 횟수를 넘긴 스로틀링 오류와 다른 오류는 그대로 전달합니다.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._acquire_token()
+            with self._slots:
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    if not self.is_throttle(e) or attempt == self.max_retries:
+                        raise
+                    error = e
+                else:
+                    self._on_success()
+                    return result
+            # 대기하는 동안에는 동시성 슬롯을 반납
+            self._on_throttle(attempt, error)
+
+    def stream(self, factory):
+        """
+        factory()가 돌려주는 이터레이터를 제한 안에서 소비하며 항목을 yield합니다.
+        첫 항목을 받기 전의 스로틀링만 재시도하며, 스트림이 끝날 때까지 동시성 슬롯을 점유합니다.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._acquire_token()
+            self._slots.acquire()
+            try:
+                iterator = iter(factory())
+                first = next(iterator)
+            except StopIteration:
+                self._slots.release()
+                self._on_success()
+                return
+            except Exception as e:
+                self._slots.release()
+                if not self.is_throttle(e) or attempt == self.max_retries:
+                    raise
+                self._on_throttle(attempt, e)
+                continue
+
+            try:
+                yield first
+                yield from iterator
+            finally:
+                self._slots.release()
+            self._on_success()
+            return
+
+
+def is_bedrock_throttle(error):
+    """
+    Bedrock 스로틀링 또는 일시적인 과부하 오류인지 확인합니다.
+    langchain이 botocore 오류를 감싸는 경우가 있어 오류 코드와 메시지를 모두 확인합니다.
+    """
+    throttle_codes = ('ThrottlingException', 'TooManyRequestsException', 'ServiceUnavailableException')
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict) and response.get('Error', {}).get('Code') in throttle_codes:
+        return True
+    message = str(error)
+    return any(throttle_code in message for throttle_code in throttle_codes) or 'Too many requests' in message
+
+
+def is_github_throttle(error):
+    """
+    GitHub의 secondary rate limit(또는 429) 응답인지 확인합니다.
+    한 시간 단위로 초기화되는 primary rate limit 초과는 재시도하지 않습니다.
+    """
+    status = getattr(error, 'status', None)
+    if status == 429:
+        return True
+    return status == 403 and 'secondary rate limit' in str(getattr(error, 'data', '')).lower()
+
+
+def github_retry_after(error):
+    """
+    GitHub 응답의 Retry-After 헤더가 있으면 대기 시간(초)으로 반환합니다.
+    """
+    headers = getattr(error, 'headers', None) or {}
+    value = {k.lower(): v for k, v in headers.items()}.get('retry-after')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
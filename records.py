@@ -0,0 +1,102 @@
+# records.py
+
+import itertools
+from dataclasses import dataclass
+
+import clients
+
+# README를 공유 저장소에서 찾지 못했을 때 사용하는 텍스트 (추천 목록의 기존 대체 문구와 같음)
+MISSING_README = "No README available."
+
+_search_ids = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class ProjectRecord:
+    """
+    세션 상태에 보관하는 추천 프로젝트 한 건입니다.
+    README 본문은 공유 텍스트 저장소에 두고 여기에는 내용 해시만 저장합니다.
+    """
+
+    __slots__ = ('name', 'description', 'url', 'forks', 'stars', 'readme_hash')
+
+    name: str
+    description: str
+    url: str
+    forks: int
+    stars: int
+    readme_hash: str
+
+    @classmethod
+    def from_repo_info(cls, info):
+        """
+        get_recommended_projects가 반환하는 repo_info 딕셔너리로 레코드를 만듭니다.
+        README를 가져오지 못한 결과(incomplete)는 대체 문구를 저장하지 않고, 처음 읽을 때 다시 가져옵니다.
+        """
+        return cls(
+            name=info['name'],
+            description=info['description'],
+            url=info['url'],
+            forks=info['forks'],
+            stars=info['stars'],
+            readme_hash=None if info.get('incomplete') else clients.get_text_store().put(info['readme']),
+        )
+
+    @property
+    def readme(self):
+        """
+        README 텍스트를 반환합니다. 공유 저장소에서 삭제되었거나 처음부터 없었으면 GitHub에서 다시 가져오며,
+        다시 가져오지 못하면 대체 문구로 요약이나 분석을 하지 않도록 예외를 발생시킵니다.
+        """
+        text = clients.get_text_store().get(self.readme_hash)
+        if text is not None:
+            return text
+        from utils import fetch_readme
+
+        try:
+            text = fetch_readme(self.name)
+        except Exception as e:
+            if getattr(e, 'status', None) == 404:
+                # README가 없는 리포지토리
+                return MISSING_README
+            raise
+        clients.get_text_store().put(text)
+        return text
+
+
+class SearchState:
+    """
+    한 번의 검색 결과와 그 결과에서 만든 요약, 번역, 분석, 진행 중인 작업 ID를 담습니다.
+
+    산출물은 (프로젝트 번호, 종류, 언어)별 텍스트 해시로만 보관하며, 새로 검색하면 객체 전체를
+    새로 만들기 때문에 이전 검색의 산출물이 세션에 남지 않습니다.
+    """
+
+    __slots__ = ('search_id', 'projects', '_artifacts', '_jobs')
+
+    def __init__(self, repo_infos):
+        self.search_id = next(_search_ids)
+        self.projects = [ProjectRecord.from_repo_info(info) for info in repo_infos]
+        self._artifacts = {}
+        self._jobs = {}
+
+    def get(self, idx, kind, language=""):
+        """
+        저장된 산출물 텍스트를 반환합니다. 아직 없거나 공유 저장소에서 삭제되었으면 None을 반환합니다.
+        """
+        return clients.get_text_store().get(self._artifacts.get((idx, kind, language)))
+
+    def put(self, idx, kind, text, language=""):
+        self._artifacts[(idx, kind, language)] = clients.get_text_store().put(text)
+
+    def job(self, idx, name):
+        """
+        프로젝트 idx(검색 전체에 대한 작업이면 None)의 진행 중인 작업 ID를 반환합니다.
+        """
+        return self._jobs.get((idx, name))
+
+    def set_job(self, idx, name, job_id):
+        if job_id is None:
+            self._jobs.pop((idx, name), None)
+        else:
+            self._jobs[(idx, name)] = job_id
@@ -0,0 +1,106 @@
+# rerank.py
+
+import math
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+VECTOR_DIM = 2 ** 12  # 해시 트릭으로 단어를 나누어 담는 차원 수
+STAR_WEIGHT = 0.1  # 관련도가 비슷할 때 별(star)이 많은 프로젝트를 앞에 두기 위한 가중치
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text):
+    """
+    소문자 단어 목록으로 나눕니다. 'c++', 'c#'처럼 기호가 붙은 기술 이름은 유지하고 한 글자 단어는 버립니다.
+    """
+    return [token for token in _TOKEN_RE.findall(text.lower()) if len(token) > 1]
+
+
+def hashed_term_frequencies(text, dim=VECTOR_DIM):
+    """
+    단어 빈도를 해시 버킷에 모은 벡터를 반환합니다. 빈도는 1 + log(tf)로 완만하게 만듭니다.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for token in tokenize(text):
+        # hash()는 프로세스마다 값이 달라지므로 안정적인 crc32 사용
+        vector[zlib.crc32(token.encode('utf-8')) % dim] += 1
+    nonzero = vector > 0
+    vector[nonzero] = 1 + np.log(vector[nonzero])
+    return vector
+
+
+def candidate_text(repo):
+    """
+    순위를 매길 때 사용하는 리포지토리 텍스트입니다. 검색 결과에 이미 들어 있는 속성만 사용하므로 추가 요청이 없습니다.
+    """
+    parts = [
+        re.sub(r"[/_.-]", " ", repo.full_name),
+        repo.description or "",
+        getattr(repo, 'language', None) or "",
+        " ".join(getattr(repo, 'topics', None) or []),
+    ]
+    return " ".join(parts)
+
+
+class Reranker:
+    """
+    검색 후보를 기술 스택과 관심 분야 텍스트와의 TF-IDF 코사인 유사도로 다시 정렬합니다.
+
+    리포지토리별 단어 빈도 벡터는 이름을 키로 최대 max_cached개까지 메모리에 보관하며,
+    설명이나 토픽이 바뀌면 다시 계산합니다. IDF는 후보 집합마다 새로 계산합니다.
+    """
+
+    def __init__(self, dim=VECTOR_DIM, max_cached=10000, star_weight=STAR_WEIGHT):
+        self.dim = dim
+        self.max_cached = max_cached
+        self.star_weight = star_weight
+        self._lock = threading.Lock()
+        self._vectors = OrderedDict()
+
+    def _vector(self, repo):
+        text = candidate_text(repo)
+        with self._lock:
+            cached = self._vectors.get(repo.full_name)
+            if cached is not None and cached[0] == text:
+                self._vectors.move_to_end(repo.full_name)
+                return cached[1]
+        vector = hashed_term_frequencies(text, self.dim)
+        with self._lock:
+            self._vectors[repo.full_name] = (text, vector)
+            self._vectors.move_to_end(repo.full_name)
+            while len(self._vectors) > self.max_cached:
+                self._vectors.popitem(last=False)
+        return vector
+
+    def scores(self, candidates, query_text):
+        """
+        후보별 점수(코사인 유사도 + 별 수 가중치)를 후보 순서대로 반환합니다.
+        """
+        if not candidates:
+            return np.zeros(0, dtype=np.float32)
+        tf = np.vstack([self._vector(repo) for repo in candidates])
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log((1 + len(candidates)) / (1 + df)) + 1
+
+        documents = tf * idf
+        documents /= np.maximum(np.linalg.norm(documents, axis=1, keepdims=True), 1e-9)
+        query = hashed_term_frequencies(query_text, self.dim) * idf
+        query /= max(np.linalg.norm(query), 1e-9)
+        similarity = documents @ query
+
+        stars = np.array([max(repo.stargazers_count or 0, 0) for repo in candidates], dtype=np.float32)
+        popularity = np.log1p(stars) / max(math.log1p(stars.max()), 1e-9)
+        return similarity + self.star_weight * popularity
+
+    def rerank(self, candidates, query_text, top_n):
+        """
+        점수가 높은 순으로 top_n개의 후보를 반환합니다. 점수가 같으면 원래(별 순) 순서를 유지합니다.
+        """
+        scores = self.scores(candidates, query_text)
+        order = sorted(range(len(candidates)), key=lambda i: -scores[i])
+        return [candidates[i] for i in order[:top_n]]
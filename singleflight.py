@@ -0,0 +1,150 @@
+# singleflight.py
+
+import logging
+import threading
+
+import metrics
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class _StreamCall:
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.chunks = []
+        self.finished = False
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합칩니다.
+
+    먼저 들어온 호출(leader)만 실제로 실행하고, 실행 중에 같은 키로 들어온 호출은
+    그 결과(또는 예외)를 기다려 함께 받습니다. 결과는 저장하지 않으므로 호출이 끝난 뒤의
+    같은 키 요청은 다시 실행되며, 결과 재사용은 캐시가 담당합니다.
+    같은 프로세스의 모든 스레드(Streamlit 세션)가 하나의 인스턴스를 공유합니다.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._streams = {}
+
+    def do(self, key, func):
+        """
+        key에 대해 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 func()를 실행합니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            metrics.registry.inc("singleflight_shared_total", group=self.name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stream(self, key, factory):
+        """
+        key에 대해 진행 중인 스트림이 있으면 그 스트림의 조각을 처음부터 함께 받고, 없으면 factory()를 소비합니다.
+        leader의 소비자가 중간에 스트림을 닫아도 기다리는 호출이 있으면 나머지를 백그라운드 스레드에서 끝까지 받습니다.
+        """
+        with self._lock:
+            call = self._streams.get(key)
+            leader = call is None
+            if leader:
+                call = self._streams[key] = _StreamCall()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            metrics.registry.inc("singleflight_shared_total", group=self.name)
+            yield from self._follow(call)
+            return
+
+        iterator = None
+        try:
+            iterator = iter(factory())
+            for chunk in iterator:
+                with call.cond:
+                    call.chunks.append(chunk)
+                    call.cond.notify_all()
+                yield chunk
+        except GeneratorExit:
+            with self._lock:
+                handoff = call.waiters > 0
+                if not handoff:
+                    # 기다리는 호출이 없으면 새 호출이 잘린 스트림에 합류하지 않도록 바로 제거
+                    del self._streams[key]
+            if handoff:
+                threading.Thread(
+                    target=self._drain, args=(key, call, iterator), name=f"{self.name}-drain", daemon=True
+                ).start()
+            elif hasattr(iterator, 'close'):
+                iterator.close()
+            raise
+        except BaseException as e:
+            self._finish(key, call, e)
+            raise
+        self._finish(key, call)
+
+    def _follow(self, call):
+        position = 0
+        while True:
+            with call.cond:
+                while position >= len(call.chunks) and not call.finished:
+                    call.cond.wait()
+                pending = call.chunks[position:]
+                finished, error = call.finished, call.error
+            position += len(pending)
+            yield from pending
+            if finished and position >= len(call.chunks):
+                if error is not None:
+                    raise error
+                return
+
+    def _drain(self, key, call, iterator):
+        try:
+            for chunk in iterator:
+                with call.cond:
+                    call.chunks.append(chunk)
+                    call.cond.notify_all()
+        except Exception as e:
+            logging.warning(f"[{self.name}] shared stream failed after the leader stopped reading: {e}")
+            self._finish(key, call, e)
+        else:
+            self._finish(key, call)
+
+    def _finish(self, key, call, error=None):
+        with self._lock:
+            if self._streams.get(key) is call:
+                del self._streams[key]
+        with call.cond:
+            call.error = error
+            call.finished = True
+            call.cond.notify_all()
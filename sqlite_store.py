@@ -0,0 +1,63 @@
+# sqlite_store.py
+
+import os
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+
+# 오래된 행 정리를 몇 번의 쓰기마다 실행할지의 상한
+TRIM_EVERY = 100
+
+
+class SQLiteStore:
+    """
+    여러 세션과 프로세스가 같은 파일을 함께 쓰는 SQLite 저장소의 공통 부분입니다.
+
+    파일과 디렉터리 생성, WAL 모드 설정, 스키마 생성, 작업마다 새로 여는 연결,
+    가장 오래 사용되지 않은 행을 지우는 크기 제한을 제공합니다.
+    """
+
+    def __init__(self, path, schema=()):
+        self.path = path
+        self._trim_lock = threading.Lock()
+        self._writes = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in schema:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connect(self):
+        """
+        새 연결을 열어 블록이 정상적으로 끝나면 커밋하고(예외가 나면 롤백) 항상 닫습니다.
+        연결은 작업마다 새로 열어 스레드와 프로세스 사이에서 안전하게 사용합니다.
+        """
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            with conn:
+                yield conn
+
+    def _trim(self, conn, table, key, order_by, max_entries):
+        """
+        order_by가 큰(최근) 순서로 max_entries개만 남기고 나머지 행을 삭제합니다.
+
+        정렬 비용이 크므로 테이블마다 max_entries의 1%(최대 TRIM_EVERY)번 쓸 때마다 한 번만 실행하며,
+        그 사이에는 행 수가 한도를 그만큼 넘을 수 있습니다.
+        """
+        interval = max(1, min(TRIM_EVERY, max_entries // 100))
+        with self._trim_lock:
+            writes = self._writes.get(table, 0) + 1
+            self._writes[table] = writes % interval
+        if writes < interval:
+            return
+        conn.execute(
+            f"""
+            DELETE FROM {table} WHERE {key} IN (
+                SELECT {key} FROM {table} ORDER BY {order_by} DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (max_entries,),
+        )
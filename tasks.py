@@ -0,0 +1,86 @@
+# tasks.py
+
+import hashlib
+
+import clients
+from pdf_export import upload_pdf_report
+from pipeline import StagePipeline
+from utils import (
+    stream_analyze_project_culture,
+    stream_generate_contribution_guidelines,
+    stream_translation,
+)
+
+# 백그라운드 작업 큐에서 실행되는 작업 함수들.
+# 작업 스레드에서 실행되므로 Streamlit 세션 상태에 접근하지 않고, 필요한 값은 모두 인자로 받습니다.
+
+
+def run_analysis(report, repo_name, readme, target_language):
+    """
+    프로젝트 문화 분석, 기여 가이드라인 생성과 각각의 번역을 수행합니다.
+    스트리밍 중인 텍스트는 report로 {stage 이름: 현재까지의 텍스트} 형태로 전달됩니다.
+    결과는 다른 세션과 공유되므로 번역이 실패하면 오류 메시지를 결과로 남기지 않고 작업을 실패로 끝냅니다.
+    """
+    def collect(stage, chunks):
+        text = ""
+        for chunk in chunks:
+            text += chunk
+            report({stage: text})
+        return text
+
+    # 문화 분석과 가이드라인 생성은 서로 독립적이므로 동시에 실행하고,
+    # 각 번역은 자신의 원문이 준비되는 즉시 시작
+    pipeline = StagePipeline(max_workers=4, name=f"analyze:{repo_name}")
+    pipeline.add(
+        'culture_analysis',
+        lambda: collect('culture_analysis', stream_analyze_project_culture(repo_name, readme)),
+    )
+    pipeline.add(
+        'guidelines',
+        lambda: collect('guidelines', stream_generate_contribution_guidelines(repo_name)),
+    )
+    if target_language:
+        pipeline.add(
+            'translated_culture_analysis',
+            lambda text: collect('translated_culture_analysis', stream_translation(text, target_language)),
+            deps=('culture_analysis',),
+        )
+        pipeline.add(
+            'translated_guidelines',
+            lambda text: collect('translated_guidelines', stream_translation(text, target_language)),
+            deps=('guidelines',),
+        )
+    return pipeline.run()
+
+
+def run_pdf_export(report, projects, bucket):
+    """
+    분석된 프로젝트 리포트를 PDF로 만들어 S3에 올리고 S3 키를 반환합니다.
+    presigned URL은 만료되므로 결과에 저장하지 않고, 화면에 보여줄 때마다 report_url로 새로 발급합니다.
+    """
+    key, reused = upload_pdf_report(projects, clients.get_s3(), bucket)
+    return {'key': key, 'reused': reused}
+
+
+def submit_analysis(repo_name, readme, target_language):
+    """
+    분석 작업을 제출하고 작업 ID를 반환합니다. 같은 입력의 분석은 다른 세션과도 같은 작업을 공유합니다.
+    """
+    readme_hash = hashlib.sha256(readme.encode('utf-8')).hexdigest()
+    return clients.get_job_queue().submit(
+        'analysis', run_analysis, repo_name, readme, target_language,
+        key=[repo_name, readme_hash, target_language],
+    )
+
+
+def submit_pdf_export(projects, bucket):
+    """
+    PDF 내보내기 작업을 제출하고 작업 ID를 반환합니다.
+    작업 결과를 재사용하지 않고 매번 새 작업을 만듭니다.
+    (같은 내용의 PDF는 upload_pdf_report가 S3에서 재사용합니다.)
+    """
+    return clients.get_job_queue().submit('pdf_export', run_pdf_export, projects, bucket)
+
+
+def get_job(job_id):
+    return clients.get_job_queue().get(job_id)
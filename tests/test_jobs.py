@@ -0,0 +1,105 @@
+# tests/test_jobs.py
+
+import threading
+import time
+
+import pytest
+
+from jobs import DONE, FAILED, RUNNING, JobQueue, JobQueueFull
+
+
+def _wait(queue, job_id, statuses=(DONE, FAILED), timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job is not None and job['status'] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not reach {statuses}.")
+
+
+def test_concurrent_submits_of_the_same_key_run_once(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+    release = threading.Event()
+    runs = []
+
+    def work(report):
+        runs.append(1)
+        release.wait(5)
+        return "done"
+
+    job_ids = []
+    barrier = threading.Barrier(4)
+
+    def submit():
+        barrier.wait()
+        job_ids.append(queue.submit('analysis', work, key=["octo/project"]))
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    release.set()
+
+    assert len(set(job_ids)) == 1
+    assert _wait(queue, job_ids[0])['result'] == "done"
+    assert len(runs) == 1
+
+
+def test_failed_job_is_run_again(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+    outcomes = iter([RuntimeError("throttled"), "done"])
+
+    def work(report):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    job_id = queue.submit('analysis', work, key="same")
+    assert _wait(queue, job_id)['error'] == "throttled"
+
+    assert queue.submit('analysis', work, key="same") == job_id
+    job = _wait(queue, job_id)
+    assert job['status'] == DONE and job['result'] == "done"
+
+
+def test_stale_running_job_is_claimed_again(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    # 작업을 실행하다가 응답이 없어진 프로세스와 이어받는 프로세스
+    stuck_queue = JobQueue(path, stale_after=0.2)
+    other_queue = JobQueue(path, stale_after=0.2)
+    release = threading.Event()
+    runs = []
+
+    def stuck(report):
+        runs.append('stuck')
+        release.wait(5)
+
+    def work(report):
+        runs.append('retry')
+        return "done"
+
+    job_id = stuck_queue.submit('analysis', stuck, key="same")
+    _wait(stuck_queue, job_id, statuses=(RUNNING,))
+    # 진행 상황이 갱신되는 동안에는 다시 실행하지 않음
+    assert other_queue.submit('analysis', work, key="same") == job_id
+    assert runs == ['stuck']
+
+    time.sleep(0.3)
+    assert other_queue.get(job_id)['status'] == FAILED
+    assert other_queue.submit('analysis', work, key="same") == job_id
+    assert _wait(other_queue, job_id)['result'] == "done"
+    assert runs == ['stuck', 'retry']
+    release.set()
+
+
+def test_submit_rejects_work_beyond_max_pending(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"), max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    queue.submit('pdf_export', lambda report: release.wait(5))
+    with pytest.raises(JobQueueFull):
+        queue.submit('pdf_export', lambda report: None)
+    release.set()
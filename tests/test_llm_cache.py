@@ -0,0 +1,65 @@
+# tests/test_llm_cache.py
+
+import time
+
+import pytest
+
+from llm_cache import LLMCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMCache(str(tmp_path / "llm_cache.sqlite3"), max_entries=2)
+
+
+def test_hit_and_miss_are_counted(cache):
+    cache.set("a", "response")
+
+    assert cache.get("a") == "response"
+    assert cache.get("missing") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_expired_entries_are_not_returned(cache):
+    cache.ttl = 0.05
+    cache.set("a", "response")
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    # 만료된 항목은 조회할 때 삭제됨
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.set("a", "first")
+    time.sleep(0.01)
+    cache.set("b", "second")
+    time.sleep(0.01)
+    # 최근에 읽은 항목은 먼저 저장되었더라도 남음
+    assert cache.get("a") == "first"
+    time.sleep(0.01)
+    cache.set("c", "third")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+
+
+def test_alternate_keys_are_checked_in_order(cache):
+    cache.set("old", "old response")
+
+    assert cache.get("new", "old") == "old response"
+    cache.set("new", "new response")
+    assert cache.get("new", "old") == "new response"
+    # 여러 키를 확인해도 조회 한 번으로 셈
+    assert cache.stats()["hits"] == 2
+
+
+def test_make_key_depends_on_every_setting():
+    key = LLMCache.make_key("model", 0.1, 1000, "prompt")
+
+    assert key == LLMCache.make_key("model", 0.1, 1000, "prompt")
+    assert key != LLMCache.make_key("other-model", 0.1, 1000, "prompt")
+    assert key != LLMCache.make_key("model", 0.5, 1000, "prompt")
+    assert key != LLMCache.make_key("model", 0.1, 2000, "prompt")
+    assert key != LLMCache.make_key("model", 0.1, 1000, "other prompt")
@@ -0,0 +1,55 @@
+# tests/test_pipeline.py
+
+import threading
+
+import pytest
+
+from pipeline import StagePipeline
+
+
+def test_stages_receive_dependency_results_in_order():
+    pipeline = StagePipeline(name="test")
+    pipeline.add('readme', lambda: "readme")
+    pipeline.add('issues', lambda: ["bug"])
+    pipeline.add('report', lambda readme, issues: f"{readme}: {issues}", deps=['readme', 'issues'])
+
+    results = pipeline.run(timeout=5)
+
+    assert results == {'readme': "readme", 'issues': ["bug"], 'report': "readme: ['bug']"}
+    assert set(pipeline.timings) == {'readme', 'issues', 'report'}
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    pipeline = StagePipeline(max_workers=2, name="test")
+    # 두 stage가 동시에 실행되지 않으면 Barrier가 시간 초과로 실패함
+    pipeline.add('a', lambda: barrier.wait())
+    pipeline.add('b', lambda: barrier.wait())
+
+    assert set(pipeline.run(timeout=5)) == {'a', 'b'}
+
+
+def test_failing_stage_stops_its_dependents():
+    ran = []
+    pipeline = StagePipeline(name="test")
+    pipeline.add('fetch', lambda: 1 / 0)
+    pipeline.add('analyze', lambda value: ran.append(value), deps=['fetch'])
+
+    with pytest.raises(ZeroDivisionError):
+        pipeline.run(timeout=5)
+    assert ran == []
+    assert 'fetch' not in pipeline.timings
+
+
+def test_add_rejects_unknown_and_duplicate_stages():
+    pipeline = StagePipeline(name="test")
+    pipeline.add('a', lambda: None)
+
+    with pytest.raises(ValueError):
+        pipeline.add('a', lambda: None)
+    with pytest.raises(ValueError):
+        pipeline.add('b', lambda value: None, deps=['missing'])
+
+
+def test_empty_pipeline_returns_no_results():
+    assert StagePipeline(name="test").run(timeout=5) == {}
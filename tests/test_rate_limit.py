@@ -0,0 +1,144 @@
+# tests/test_rate_limit.py
+
+import threading
+import time
+
+import pytest
+
+from rate_limit import AdaptiveRateLimiter, github_retry_after, is_bedrock_throttle, is_github_throttle
+
+
+class Throttled(Exception):
+    pass
+
+
+def _limiter(**kwargs):
+    options = dict(rate=100, max_concurrency=4, base_delay=0.001, is_throttle=lambda e: isinstance(e, Throttled))
+    options.update(kwargs)
+    return AdaptiveRateLimiter('test', **options)
+
+
+def _flaky(failures, result="ok"):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise Throttled("slow down")
+        return result
+    return func, calls
+
+
+def test_throttle_backs_off_and_retries_until_success():
+    limiter = _limiter(rate=10, max_rate=10)
+    func, calls = _flaky(2)
+
+    assert limiter.call(func) == "ok"
+    assert len(calls) == 3
+    # 두 번 줄인 뒤 성공 한 번만큼 다시 올림
+    assert limiter.rate == pytest.approx(10 * 0.5 * 0.5 + limiter.increase)
+
+
+def test_rate_recovers_up_to_max_rate_only():
+    limiter = _limiter(rate=10, max_rate=10, increase=1)
+    func, _ = _flaky(1)
+    limiter.call(func)
+    assert limiter.rate == 6
+
+    for _ in range(10):
+        limiter.call(lambda: None)
+    assert limiter.rate == 10
+
+
+def test_gives_up_after_max_retries():
+    limiter = _limiter(max_retries=2)
+    func, calls = _flaky(10)
+
+    with pytest.raises(Throttled):
+        limiter.call(func)
+    assert len(calls) == 3
+
+
+def test_other_errors_are_not_retried():
+    limiter = _limiter()
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        limiter.call(func)
+    assert len(calls) == 1
+    assert limiter.rate == 100
+
+
+def test_retry_after_overrides_the_backoff():
+    limiter = _limiter(retry_after=lambda e: 0.05)
+    func, _ = _flaky(1)
+
+    started = time.monotonic()
+    limiter.call(func)
+    assert time.monotonic() - started >= 0.05
+
+
+def test_stream_retries_only_before_the_first_item():
+    limiter = _limiter()
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise Throttled("slow down")
+        yield "a"
+        yield "b"
+
+    assert list(limiter.stream(factory)) == ["a", "b"]
+    assert len(attempts) == 2
+
+    def fails_midway():
+        yield "a"
+        raise Throttled("slow down")
+
+    stream = limiter.stream(fails_midway)
+    assert next(stream) == "a"
+    with pytest.raises(Throttled):
+        next(stream)
+
+
+def test_concurrency_is_limited():
+    limiter = _limiter(max_concurrency=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    threads = [threading.Thread(target=limiter.call, args=(work,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert peak[0] == 2
+
+
+def test_throttle_detection():
+    class BotoError(Exception):
+        response = {'Error': {'Code': 'ThrottlingException'}}
+
+    class GithubError(Exception):
+        def __init__(self, status, data, headers=None):
+            super().__init__(status)
+            self.status, self.data, self.headers = status, data, headers or {}
+
+    assert is_bedrock_throttle(BotoError())
+    assert not is_bedrock_throttle(ValueError("validation failed"))
+    assert is_github_throttle(GithubError(429, ""))
+    assert is_github_throttle(GithubError(403, {"message": "You have exceeded a secondary rate limit."}))
+    assert not is_github_throttle(GithubError(403, {"message": "API rate limit exceeded"}))
+    assert github_retry_after(GithubError(429, "", {"Retry-After": "7"})) == 7.0
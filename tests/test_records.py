@@ -0,0 +1,57 @@
+# tests/test_records.py
+
+import time
+
+import pytest
+
+import clients
+import records
+import text_store
+import utils
+from text_store import TextStore
+
+REPO_INFO = {'name': "octo/project", 'description': "", 'url': "", 'forks': 0, 'stars': 0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    clients.override('text_store', TextStore(str(tmp_path / "text_store.sqlite3"), max_entries=2))
+    yield clients.get_text_store()
+    clients.reset()
+
+
+def _stored_texts(store):
+    with store._connect() as conn:
+        return sorted(row[0] for row in conn.execute("SELECT text FROM texts"))
+
+
+def test_texts_read_from_memory_are_not_evicted_first(store, monkeypatch):
+    monkeypatch.setattr(text_store, 'TOUCH_INTERVAL', 0)
+    hot = store.put("hot")
+    for i in range(3):
+        time.sleep(0.01)
+        store.put(f"cold {i}")
+        assert store.get(hot) == "hot"
+
+    assert _stored_texts(store) == ["cold 2", "hot"]
+
+
+def test_missing_readme_is_fetched_again(store, monkeypatch):
+    record = records.ProjectRecord.from_repo_info({**REPO_INFO, 'readme': "No README available.", 'incomplete': True})
+    monkeypatch.setattr(utils, 'fetch_readme', lambda name: f"# {name}")
+
+    assert record.readme == "# octo/project"
+
+
+def test_readme_that_cannot_be_fetched_raises(store, monkeypatch):
+    record = records.ProjectRecord.from_repo_info({**REPO_INFO, 'readme': "# README"})
+    with store._connect() as conn:
+        conn.execute("DELETE FROM texts")
+    store._memory.clear()
+
+    def unavailable(name):
+        raise TimeoutError("GitHub did not answer")
+
+    monkeypatch.setattr(utils, 'fetch_readme', unavailable)
+    with pytest.raises(TimeoutError):
+        record.readme
@@ -0,0 +1,193 @@
+# tests/test_singleflight.py
+
+import threading
+import time
+
+from singleflight import SingleFlight
+
+CHUNKS = ["a", "b", "c", "d"]
+
+
+class GatedStream:
+    """
+    release()를 호출할 때마다 조각을 하나씩 내보내는 스트림입니다.
+    """
+
+    def __init__(self, chunks=CHUNKS):
+        self.chunks = list(chunks)
+        self.calls = 0
+        self._gate = threading.Semaphore(0)
+
+    def factory(self):
+        self.calls += 1
+        for chunk in self.chunks:
+            assert self._gate.acquire(timeout=5), "stream was never released"
+            yield chunk
+
+    def release(self, count=1):
+        for _ in range(count):
+            self._gate.release()
+
+
+def _consume(iterator, into):
+    def run():
+        for chunk in iterator:
+            into.append(chunk)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition was never met"
+        time.sleep(0.005)
+
+
+def test_do_runs_concurrent_calls_once():
+    flights = SingleFlight('test')
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("key", func)))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(flights.do("key", func)))
+    follower.start()
+    _wait_for(lambda: flights._calls["key"].waiters == 1)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == ["result", "result"]
+    assert len(calls) == 1
+
+
+def test_do_shares_the_leader_error():
+    flights = SingleFlight('test')
+    started, release = threading.Event(), threading.Event()
+
+    def func():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            flights.do("key", func)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    _wait_for(lambda: flights._calls["key"].waiters == 1)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+    # 호출이 끝나면 결과를 보관하지 않으므로 다음 호출은 다시 실행됨
+    assert flights.do("key", lambda: "again") == "again"
+
+
+def test_follower_joining_mid_stream_replays_from_the_start():
+    flights = SingleFlight('test')
+    stream = GatedStream()
+    leader_chunks, follower_chunks = [], []
+
+    leader = _consume(flights.stream("key", stream.factory), leader_chunks)
+    stream.release(2)
+    _wait_for(lambda: leader_chunks == CHUNKS[:2])
+    follower = _consume(flights.stream("key", stream.factory), follower_chunks)
+    _wait_for(lambda: flights._streams["key"].waiters == 1)
+    stream.release(2)
+    leader.join(5)
+    follower.join(5)
+
+    assert leader_chunks == CHUNKS
+    assert follower_chunks == CHUNKS
+    assert stream.calls == 1
+
+
+def test_leader_closing_early_hands_the_stream_to_followers():
+    flights = SingleFlight('test')
+    stream = GatedStream()
+    follower_chunks = []
+
+    leader = flights.stream("key", stream.factory)
+    stream.release()
+    assert next(leader) == "a"
+    follower = _consume(flights.stream("key", stream.factory), follower_chunks)
+    _wait_for(lambda: flights._streams["key"].waiters == 1)
+
+    # leader의 소비자가 떠나도 기다리는 호출이 있으므로 백그라운드에서 끝까지 받음
+    leader.close()
+    late_chunks = []
+    late = _consume(flights.stream("key", stream.factory), late_chunks)
+    stream.release(3)
+    follower.join(5)
+    late.join(5)
+
+    assert follower_chunks == CHUNKS
+    assert late_chunks == CHUNKS
+    assert stream.calls == 1
+    _wait_for(lambda: "key" not in flights._streams)
+
+
+def test_leader_closing_without_followers_does_not_leave_a_truncated_stream():
+    flights = SingleFlight('test')
+    first = GatedStream()
+
+    leader = flights.stream("key", first.factory)
+    first.release()
+    assert next(leader) == "a"
+    leader.close()
+
+    assert "key" not in flights._streams
+    second = GatedStream()
+    second.release(len(CHUNKS))
+    assert list(flights.stream("key", second.factory)) == CHUNKS
+    assert second.calls == 1
+
+
+def test_stream_error_reaches_followers():
+    flights = SingleFlight('test')
+    stream = GatedStream()
+
+    def failing():
+        yield from stream.factory()
+        raise ValueError("stream failed")
+
+    errors = []
+
+    def consume():
+        try:
+            list(flights.stream("key", failing))
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=consume)
+    leader.start()
+    _wait_for(lambda: "key" in flights._streams)
+    follower = threading.Thread(target=consume)
+    follower.start()
+    _wait_for(lambda: flights._streams["key"].waiters == 1)
+    stream.release(len(CHUNKS))
+    leader.join(5)
+    follower.join(5)
+
+    assert len(errors) == 2
+    assert "key" not in flights._streams
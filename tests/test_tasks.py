@@ -0,0 +1,56 @@
+# tests/test_tasks.py
+
+import time
+
+import pytest
+
+import clients
+import tasks
+import utils
+from jobs import DONE, FAILED, JobQueue
+from translation_memory import TranslationMemory
+
+CULTURE = "The maintainers review every pull request and welcome first-time contributors."
+GUIDELINES = "Open an issue before starting work and follow the existing code style of the project."
+
+
+@pytest.fixture
+def job_queue(monkeypatch, tmp_path):
+    clients.override('job_queue', JobQueue(str(tmp_path / "jobs.sqlite3")))
+    clients.override('translation_memory', TranslationMemory(str(tmp_path / "translation_memory.sqlite3")))
+    monkeypatch.setattr(tasks, 'stream_analyze_project_culture', lambda repo_name, readme: iter([CULTURE]))
+    monkeypatch.setattr(tasks, 'stream_generate_contribution_guidelines', lambda repo_name: iter([GUIDELINES]))
+    yield clients.get_job_queue()
+    clients.reset()
+
+
+def _wait(job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = tasks.get_job(job_id)
+        if job['status'] in (DONE, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish.")
+
+
+def test_failed_translation_fails_the_job_and_can_be_retried(job_queue, monkeypatch):
+    def throttled(prompt, task):
+        raise RuntimeError("ThrottlingException: Too many requests")
+        yield
+
+    monkeypatch.setattr(utils, '_stream_llm', throttled)
+    job_id = tasks.submit_analysis("octo/project", "README", "Korean")
+    job = _wait(job_id)
+    assert job['status'] == FAILED
+    assert job['result'] is None
+
+    def translated(prompt, task):
+        yield "번역된 텍스트"
+
+    monkeypatch.setattr(utils, '_stream_llm', translated)
+    # 실패한 작업은 같은 입력으로 다시 제출하면 다시 실행됨
+    assert tasks.submit_analysis("octo/project", "README", "Korean") == job_id
+    job = _wait(job_id)
+    assert job['status'] == DONE
+    assert not any(value.startswith("Error during") for value in job['result'].values())
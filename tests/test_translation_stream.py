@@ -0,0 +1,85 @@
+# tests/test_translation_stream.py
+
+import re
+
+import pytest
+
+import clients
+import utils
+from translation import segment_key
+from translation_memory import TranslationMemory
+
+TEXT = (
+    "This is the first paragraph of the project summary.\n\n"
+    "The second paragraph explains how to contribute to the project.\n\n"
+    "The third paragraph lists the maintainers of the project."
+)
+
+
+def _translate(segment):
+    return "KO " + " ".join(segment.split())
+
+
+def _originals(prompt):
+    # 프롬프트 끝의 번역할 본문(번호가 있으면 번호별 문단)을 꺼냄
+    body = prompt.split("\n\n", 1)[1]
+    parts = re.split(r"^\[\[\d+\]\]\n", body, flags=re.MULTILINE)
+    if len(parts) == 1:
+        return body.split("\n\n")
+    return [part.strip() for part in parts if part.strip()]
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, tmp_path):
+    clients.override('translation_memory', TranslationMemory(str(tmp_path / "translation_memory.sqlite3")))
+    prompts = []
+
+    def install(segmented_response):
+        def stream(prompt, task):
+            prompts.append(prompt)
+            originals = _originals(prompt)
+            if "[[1]]" in prompt:
+                response = segmented_response(originals)
+            else:
+                response = "\n\n".join(_translate(original) for original in originals)
+            # 표시가 조각 사이에서 나뉘는 경우도 확인하도록 몇 글자씩 나눠 보냄
+            for start in range(0, len(response), 7):
+                yield response[start:start + 7]
+
+        monkeypatch.setattr(utils, '_stream_llm', stream)
+        return prompts
+
+    yield install
+    clients.reset()
+
+
+def _expected():
+    return "\n\n".join(_translate(paragraph) for paragraph in TEXT.split("\n\n"))
+
+
+def test_stream_translation_with_markers(fake_llm):
+    prompts = fake_llm(lambda originals: "\n\n".join(
+        f"[[{i}]]\n{_translate(original)}" for i, original in enumerate(originals, 1)
+    ))
+
+    assert "".join(utils.stream_translate_text_with_claude(TEXT, "Korean")) == _expected()
+    assert len(prompts) == 1
+
+
+def test_stream_translation_without_markers_falls_back(fake_llm):
+    prompts = fake_llm(lambda originals: "\n\n".join(_translate(original) for original in originals))
+
+    assert "".join(utils.stream_translate_text_with_claude(TEXT, "Korean")) == _expected()
+    assert len(prompts) == 2
+    # 잘못된 응답은 번역 메모리에 저장하지 않음
+    keys = [segment_key(paragraph, "Korean") for paragraph in TEXT.split("\n\n")]
+    assert clients.get_translation_memory().get_many(keys) == {}
+    assert "".join(utils.stream_translate_text_with_claude(TEXT, "Korean")) == _expected()
+    assert len(prompts) == 4
+
+
+def test_stream_translation_with_missing_marker_keeps_every_paragraph(fake_llm):
+    # 두 번째 문단의 번역이 통째로 빠진 응답
+    fake_llm(lambda originals: f"[[1]]\n{_translate(originals[0])}\n\n[[3]]\n{_translate(originals[2])}")
+
+    assert "".join(utils.stream_translate_text_with_claude(TEXT, "Korean")) == _expected()
@@ -0,0 +1,36 @@
+# tests/test_warm.py
+
+import warm
+from precomputed import PrecomputedIndex
+
+QUERY = {'tech_stack': "Python", 'interest_areas': "web"}
+
+
+def _project(name, incomplete=False):
+    return {'name': name, 'description': "", 'url': "", 'forks': 0, 'stars': 0,
+            'readme': "No README available." if incomplete else "# README", 'incomplete': incomplete}
+
+
+def test_query_with_fallback_entries_is_not_saved(monkeypatch, tmp_path):
+    index = PrecomputedIndex(str(tmp_path / "precomputed.sqlite3"))
+    monkeypatch.setattr(
+        warm, 'get_recommended_projects',
+        lambda tech_stack, interest_areas, timeout: [_project("a/complete"), _project("b/timed-out", True)],
+    )
+
+    projects = warm.warm_query(index, QUERY)
+
+    assert [project['name'] for project in projects] == ["a/complete"]
+    assert index.get_projects(QUERY['tech_stack'], QUERY['interest_areas']) is None
+
+
+def test_complete_query_is_saved(monkeypatch, tmp_path):
+    index = PrecomputedIndex(str(tmp_path / "precomputed.sqlite3"))
+    monkeypatch.setattr(
+        warm, 'get_recommended_projects',
+        lambda tech_stack, interest_areas, timeout: [_project("a/complete")],
+    )
+
+    warm.warm_query(index, QUERY)
+
+    assert [project['name'] for project in index.get_projects("python", "web")] == ["a/complete"]
@@ -0,0 +1,110 @@
+# text_store.py
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from sqlite_store import SQLiteStore
+
+TOUCH_INTERVAL = 30  # 메모리에서 읽은 텍스트의 사용 시각을 SQLite에 모아서 반영하는 간격(초)
+
+
+class TextStore(SQLiteStore):
+    """
+    README, 요약, 분석 결과 같은 긴 텍스트를 내용 해시(SHA-256)로 저장하는 공유 저장소입니다.
+
+    세션 상태에는 해시만 두고 본문은 여기서 꺼내 쓰므로, 같은 텍스트는 세션이 몇 개든 한 번만 저장됩니다.
+    최근에 사용한 텍스트는 memory_bytes까지 메모리에 두고, 전체는 SQLite 파일에 max_entries개까지
+    가장 오래 사용되지 않은 항목부터 삭제하며 보관합니다.
+    """
+
+    def __init__(self, path, max_entries=20000, memory_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.memory_bytes = memory_bytes
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._touched = set()
+        self._last_touch = time.monotonic()
+        super().__init__(path, (
+            """
+            CREATE TABLE IF NOT EXISTS texts (
+                digest TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_texts_accessed ON texts (accessed_at)",
+        ))
+
+    @staticmethod
+    def digest(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _remember(self, digest, text):
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return
+            self._memory[digest] = text
+            self._memory_size += len(text)
+            while self._memory_size > self.memory_bytes and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def put(self, text):
+        """
+        텍스트를 저장하고 해시를 반환합니다. 이미 있는 텍스트는 다시 쓰지 않습니다.
+        """
+        digest = self.digest(text)
+        with self._connect() as conn:
+            # 이미 있으면 사용 시각만 갱신
+            conn.execute(
+                "INSERT INTO texts (digest, text, accessed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET accessed_at = excluded.accessed_at",
+                (digest, text, time.time()),
+            )
+            self._trim(conn, "texts", "digest", "accessed_at", self.max_entries)
+        self._remember(digest, text)
+        return digest
+
+    def get(self, digest):
+        """
+        해시에 해당하는 텍스트를 반환합니다. 없거나 삭제되었으면 None을 반환합니다.
+        """
+        if digest is None:
+            return None
+        with self._lock:
+            text = self._memory.get(digest)
+            if text is not None:
+                self._memory.move_to_end(digest)
+        if text is not None:
+            self._touch(digest)
+            return text
+        with self._connect() as conn:
+            row = conn.execute("SELECT text FROM texts WHERE digest = ?", (digest,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE texts SET accessed_at = ? WHERE digest = ?", (time.time(), digest))
+        self._remember(digest, row[0])
+        return row[0]
+
+    def _touch(self, digest):
+        # 메모리에서 읽은 텍스트도 SQLite의 사용 시각을 갱신해야 자주 읽는 텍스트가 먼저 삭제되지 않음.
+        # 읽을 때마다 쓰지 않고 TOUCH_INTERVAL마다 모아서 갱신하며, 그 사이 삭제된 텍스트는 메모리의 내용으로 다시 저장
+        with self._lock:
+            self._touched.add(digest)
+            now = time.monotonic()
+            if now - self._last_touch < TOUCH_INTERVAL:
+                return
+            touched = [(d, self._memory[d]) for d in self._touched if d in self._memory]
+            self._touched = set()
+            self._last_touch = now
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO texts (digest, text, accessed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET accessed_at = excluded.accessed_at",
+                [(d, text, now) for d, text in touched],
+            )
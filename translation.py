@@ -0,0 +1,221 @@
+# translation.py
+"""
+번역 호출을 줄이기 위한 도구들: 로컬 언어 감지, 문단 단위 분할, 여러 문단을 한 번에 번역하는 프롬프트와 응답 파싱.
+"""
+
+import hashlib
+import re
+
+# 대상 언어 입력(영문 이름, 자국어 이름, 코드)을 언어 코드로 변환
+_LANGUAGE_CODES = {
+    'en': ('english', 'en', 'eng', '영어'),
+    'ko': ('korean', 'ko', 'kr', 'kor', '한국어', '한국말'),
+    'ja': ('japanese', 'ja', 'jp', '日本語', '일본어'),
+    'zh': ('chinese', 'zh', '中文', '중국어'),
+    'es': ('spanish', 'es', 'español', 'espanol', '스페인어'),
+    'fr': ('french', 'fr', 'français', 'francais', '프랑스어'),
+    'de': ('german', 'de', 'deutsch', '독일어'),
+    'pt': ('portuguese', 'pt', 'português', 'portugues', '포르투갈어'),
+    'it': ('italian', 'it', 'italiano', '이탈리아어'),
+    'nl': ('dutch', 'nl', 'nederlands', '네덜란드어'),
+    'th': ('thai', 'th', 'ไทย', '태국어'),
+    'el': ('greek', 'el', 'ελληνικά', '그리스어'),
+    'he': ('hebrew', 'he', 'עברית', '히브리어'),
+}
+_NAME_TO_CODE = {name: code for code, names in _LANGUAGE_CODES.items() for name in names}
+
+# 라틴 문자 언어를 구분하는 자주 쓰이는 단어
+_STOPWORDS = {
+    'en': {'the', 'and', 'of', 'to', 'is', 'in', 'for', 'with', 'that', 'this', 'are', 'it', 'on', 'as', 'be', 'by'},
+    'es': {'el', 'la', 'de', 'que', 'y', 'en', 'los', 'las', 'del', 'se', 'por', 'con', 'para', 'una', 'es', 'su'},
+    'fr': {'le', 'la', 'les', 'de', 'des', 'et', 'est', 'en', 'du', 'une', 'pour', 'que', 'dans', 'qui', 'sur', 'au'},
+    'de': {'der', 'die', 'das', 'und', 'ist', 'zu', 'den', 'mit', 'von', 'für', 'nicht', 'ein', 'eine', 'auf', 'sich'},
+    'pt': {'o', 'a', 'de', 'que', 'e', 'do', 'da', 'em', 'um', 'para', 'com', 'não', 'uma', 'os', 'no', 'se'},
+    'it': {'il', 'di', 'che', 'e', 'la', 'per', 'un', 'non', 'con', 'sono', 'del', 'della', 'gli', 'le', 'una'},
+    'nl': {'de', 'het', 'een', 'en', 'van', 'is', 'dat', 'op', 'te', 'voor', 'met', 'zijn', 'niet', 'ook', 'die'},
+}
+
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_MARKER_RE = re.compile(r"^\[\[(\d+)\]\][ \t]*\n?", re.MULTILINE)
+_PARTIAL_MARKER_RE = re.compile(r"\[(\[(\d+(\]\]?)?)?)?")
+
+
+def language_code(name):
+    """
+    대상 언어 이름을 언어 코드로 바꿉니다. 알 수 없는 언어면 None을 반환합니다.
+    """
+    return _NAME_TO_CODE.get((name or "").strip().lower())
+
+
+def detect_language(text):
+    """
+    문자 체계와 자주 쓰이는 단어 비율로 텍스트의 언어 코드를 추정합니다.
+    확신할 수 없으면 None을 반환하므로, None이면 번역을 생략하지 않아야 합니다.
+    """
+    counts = {'hangul': 0, 'kana': 0, 'han': 0, 'thai': 0, 'greek': 0, 'hebrew': 0, 'latin': 0, 'other': 0}
+    for char in text:
+        if not char.isalpha():
+            continue
+        code = ord(char)
+        if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+            counts['hangul'] += 1
+        elif 0x3040 <= code <= 0x30FF:
+            counts['kana'] += 1
+        elif 0x4E00 <= code <= 0x9FFF:
+            counts['han'] += 1
+        elif 0x0E00 <= code <= 0x0E7F:
+            counts['thai'] += 1
+        elif 0x0370 <= code <= 0x03FF:
+            counts['greek'] += 1
+        elif 0x0590 <= code <= 0x05FF:
+            counts['hebrew'] += 1
+        elif code < 0x0250:
+            counts['latin'] += 1
+        else:
+            counts['other'] += 1
+
+    letters = sum(counts.values())
+    if letters == 0:
+        return None
+    # 코드나 고유명사로 라틴 문자가 섞여 있어도 해당 문자가 충분히 많으면 그 언어로 판단
+    if counts['hangul'] / letters > 0.3:
+        return 'ko'
+    if counts['kana'] / letters > 0.1:
+        return 'ja'
+    if counts['han'] / letters > 0.3:
+        return 'zh'
+    for script, code in (('thai', 'th'), ('greek', 'el'), ('hebrew', 'he')):
+        if counts[script] / letters > 0.3:
+            return code
+    if counts['latin'] / letters < 0.9:
+        return None
+
+    words = [word.lower() for word in _WORD_RE.findall(text)]
+    if len(words) < 5:
+        return None
+    scores = sorted(
+        ((sum(word in stopwords for word in words) / len(words), code) for code, stopwords in _STOPWORDS.items()),
+        reverse=True,
+    )
+    (best, code), (second, _) = scores[0], scores[1]
+    if best >= 0.1 and best >= second * 1.5:
+        return code
+    return None
+
+
+def is_same_language(text, target_language):
+    """
+    텍스트가 이미 대상 언어로 쓰여 있다고 확신할 수 있으면 True를 반환합니다.
+    """
+    target = language_code(target_language)
+    return target is not None and detect_language(text) == target
+
+
+def split_segments(text):
+    """
+    텍스트를 빈 줄 기준의 문단으로 나눕니다. 코드 블록은 안의 빈 줄과 관계없이 한 문단으로 유지합니다.
+    """
+    segments = []
+    current = []
+    in_code = False
+    for line in text.split("\n"):
+        if line.strip().startswith("```"):
+            in_code = not in_code
+        if not line.strip() and not in_code:
+            if current:
+                segments.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        segments.append("\n".join(current))
+    return segments
+
+
+def needs_translation(segment):
+    """
+    코드 블록이나 글자가 없는 문단(숫자, 기호, URL만 있는 경우)은 번역하지 않고 그대로 사용합니다.
+    """
+    stripped = segment.strip()
+    if stripped.startswith("```"):
+        return False
+    without_urls = re.sub(r"https?://\S+", "", stripped)
+    return bool(_WORD_RE.search(without_urls))
+
+
+def segment_key(segment, target_language):
+    """
+    번역 메모리 키를 만듭니다. 공백 차이는 무시하고, 같은 언어의 다른 표기(Korean, 한국어)는 같은 키를 사용합니다.
+    """
+    normalized = " ".join(segment.split())
+    language = language_code(target_language) or (target_language or "").strip().lower()
+    return hashlib.sha256(f"{language}\n{normalized}".encode('utf-8')).hexdigest()
+
+
+def build_segments_prompt(segments, target_language):
+    """
+    여러 문단을 번호 표시와 함께 한 번에 번역하도록 요청하는 프롬프트를 만듭니다.
+    """
+    numbered = "\n\n".join(f"[[{i}]]\n{segment}" for i, segment in enumerate(segments, 1))
+    return (
+        f"Translate each numbered segment below into {target_language}. "
+        f"Keep every marker such as [[1]] exactly as it is on its own line, followed by the translation of that segment. "
+        f"Keep Markdown formatting, code and URLs unchanged. "
+        f"Provide only the markers and translated text without any additional comments or explanations.\n\n"
+        f"{numbered}"
+    )
+
+
+def parse_segments(response, count):
+    """
+    번호가 붙은 번역 응답을 문단 목록으로 나눕니다. 표시가 빠지거나 순서가 어긋나면 None을 반환합니다.
+    """
+    matches = list(_MARKER_RE.finditer(response))
+    if [int(m.group(1)) for m in matches] != list(range(1, count + 1)):
+        return None
+    bounds = [m.end() for m in matches]
+    ends = [m.start() for m in matches[1:]] + [len(response)]
+    return [response[start:end].strip() for start, end in zip(bounds, ends)]
+
+
+class SegmentStreamParser:
+    """
+    번호가 붙은 번역 응답을 스트리밍으로 받으면서 (문단 번호, 텍스트 조각)을 만들어 냅니다.
+    표시의 일부만 도착했을 수 있는 마지막 줄과 문단 끝의 공백은 다음 조각이 올 때까지 보류합니다.
+    """
+
+    def __init__(self):
+        self.segment = 0
+        self._buffer = ""
+        self._leading = True
+
+    def feed(self, chunk):
+        self._buffer += chunk
+        pieces = []
+        match = _MARKER_RE.search(self._buffer)
+        while match is not None:
+            pieces.extend(self._emit(self._buffer[:match.start()].rstrip()))
+            self.segment = int(match.group(1))
+            self._leading = True
+            self._buffer = self._buffer[match.end():]
+            match = _MARKER_RE.search(self._buffer)
+
+        last_line = self._buffer[self._buffer.rfind("\n") + 1:]
+        hold = len(self._buffer) - len(last_line) if _PARTIAL_MARKER_RE.fullmatch(last_line) else len(self._buffer)
+        text = self._buffer[:hold].rstrip()
+        pieces.extend(self._emit(text))
+        self._buffer = self._buffer[len(text):]
+        return pieces
+
+    def close(self):
+        text, self._buffer = self._buffer.rstrip(), ""
+        return self._emit(text)
+
+    def _emit(self, text):
+        if self._leading:
+            text = text.lstrip()
+            if text:
+                self._leading = False
+        if not text or self.segment == 0:
+            return []
+        return [(self.segment, text)]
@@ -0,0 +1,60 @@
+# translation_memory.py
+
+import time
+
+from sqlite_store import SQLiteStore
+
+
+class TranslationMemory(SQLiteStore):
+    """
+    문단 단위 번역 결과를 (정규화된 문단, 대상 언어) 키로 저장하는 SQLite 번역 메모리입니다.
+
+    같은 파일을 사용하는 모든 세션과 프로세스가 공유하며,
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제됩니다.
+    """
+
+    def __init__(self, path, max_entries=50000):
+        self.max_entries = max_entries
+        super().__init__(path, (
+            """
+            CREATE TABLE IF NOT EXISTS segments (
+                key TEXT PRIMARY KEY,
+                translation TEXT NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_segments_accessed ON segments (accessed_at)",
+        ))
+
+    def get_many(self, keys):
+        """
+        저장된 번역을 {키: 번역} 딕셔너리로 반환합니다. 없는 키는 결과에 포함되지 않습니다.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT key, translation FROM segments WHERE key IN ({placeholders})", keys
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE segments SET accessed_at = ? WHERE key IN ({','.join('?' * len(rows))})",
+                    [time.time()] + [row[0] for row in rows],
+                )
+        return dict(rows)
+
+    def put_many(self, translations):
+        """
+        {키: 번역} 딕셔너리를 저장하고 최대 항목 수를 넘은 만큼 오래된 항목을 삭제합니다.
+        """
+        if not translations:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO segments (key, translation, accessed_at) VALUES (?, ?, ?)",
+                [(key, translation, now) for key, translation in translations.items()],
+            )
+            self._trim(conn, "segments", "key", "accessed_at", self.max_entries)
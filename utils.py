@@ -1,36 +1,155 @@
 # utils.py
 
 import config
-import boto3
-from github import Github
-from langchain_aws import ChatBedrock
-from langchain_core.prompts import PromptTemplate
-from langchain.chains import LLMChain
-import tiktoken, json
-
-MODEL_ID = "anthropic.claude-3-5-sonnet-20240620-v1:0"  # 사용 중인 모델 ID
-TEMPERATURE = 0.7  # 모델의 출력 다양성 조절 (낮을수록 보수적, 높을수록 다양)
-MAX_TOKENS = 1000  # 최대 토큰 수 설정
-REGION_NAME = 'us-east-1'  # AWS Bedrock 실행 리전
-
-# Initialize the GitHub API client
-github = Github(config.GITHUB_API_TOKEN)
-
-# Initialize the Bedrock Client
-bedrock_runtime = boto3.client('bedrock-runtime', region_name='us-east-1')
-
-# Initialize the Bedrock LLM
-llm = ChatBedrock(
-    model_id=MODEL_ID,
-    client=bedrock_runtime,
-    model_kwargs={
-        "temperature": TEMPERATURE,  # 다양성 설정
-        "max_tokens": MAX_TOKENS  # 최대 토큰 수 설정
-    }
+import clients
+import metrics
+import json
+import re
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from itertools import islice
+from github_graphql import GraphQLRepository
+from llm_cache import LLMCache
+from singleflight import SingleFlight
+from translation import (
+    SegmentStreamParser,
+    build_segments_prompt,
+    is_same_language,
+    needs_translation,
+    parse_segments,
+    segment_key,
+    split_segments,
 )
 
+# 작업별 모델, temperature, max_tokens는 config.LLM_ROUTES에서 설정
+MAX_TOKENS = 1000  # 요약 길이의 기본 목표 토큰 수
+
+MAX_RECOMMENDATIONS = 5  # 추천할 프로젝트 수
+CANDIDATE_POOL = 100  # 순위를 다시 매기기 위해 검색에서 가져오는 후보 수 (README와 요약은 상위 MAX_RECOMMENDATIONS개만)
+FETCH_WORKERS = 5  # README 조회 및 설명 요약을 병렬로 수행할 스레드 수
+REPO_FETCH_TIMEOUT = 20  # 리포지토리 하나를 가져오는 데 허용하는 최대 시간(초)
+
+SUMMARY_CHUNK_TOKENS = 3000  # README 요약 시 한 번의 호출에 넣는 최대 토큰 수
+MAX_README_TOKENS = 24000  # 요약에 사용하는 README의 최대 토큰 수 (초과분은 버림)
+SUMMARY_WORKERS = 4  # 청크 요약을 병렬로 수행할 스레드 수
+MAX_CODE_BLOCK_LINES = 15  # 이보다 긴 코드 블록은 요약 전에 생략
+
+class GitHubRateLimitError(Exception):
+    """GitHub API 사용 한도를 초과했을 때 발생합니다."""
+
+# 여러 세션이 같은 프롬프트나 GitHub 요청을 동시에 보내면 하나의 호출 결과를 함께 사용
+_llm_flights = SingleFlight('llm')
+_github_flights = SingleFlight('github')
+
+def _model_chain(task):
+    """
+    작업에 배정된 (model_id, temperature, max_tokens) 설정을 시도할 순서대로 반환합니다.
+    첫 번째가 기본 모델이고 나머지는 오류 시 사용할 대체 모델입니다.
+    """
+    route = config.LLM_ROUTES[task]
+    model_ids = []
+    for model_id in [route['model_id']] + route['fallbacks']:
+        if model_id not in model_ids:
+            model_ids.append(model_id)
+    return [(model_id, route['temperature'], route['max_tokens']) for model_id in model_ids]
+
+def _cache_keys(chain, prompt):
+    return [LLMCache.make_key(model_id, temperature, max_tokens, prompt) for model_id, temperature, max_tokens in chain]
+
+def _record_fallback(task, model_id, error):
+    logging.warning(f"LLM call for {task} failed on {model_id}; trying the next model: {error}")
+    metrics.registry.inc('llm_fallbacks_total', task=task, model=model_id)
+
+def _invoke_llm(prompt, task):
+    """
+    렌더링된 프롬프트로 작업에 배정된 모델을 호출합니다. 호출이 실패하면 대체 모델을 순서대로 시도합니다.
+    같은 작업 설정과 프롬프트의 응답은 캐시에서 반환하고,
+    같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 기다립니다.
+    task는 모델 라우팅 키이자 지표 라벨로 사용되는 작업 이름입니다.
+    """
+    llm_cache = clients.get_llm_cache()
+    chain = _model_chain(task)
+    keys = _cache_keys(chain, prompt)
+    cached = llm_cache.get(*keys)
+    if cached is not None:
+        metrics.record_cache('llm', 'hit')
+        return cached
+    metrics.record_cache('llm', 'miss')
+
+    def call():
+        for i, ((model_id, temperature, max_tokens), key) in enumerate(zip(chain, keys)):
+            llm = clients.get_llm(model_id, temperature, max_tokens)
+            try:
+                with metrics.timed('llm.invoke', task=task, model=model_id):
+                    # 스로틀링되면 제한기가 백오프 후 재시도
+                    response = clients.get_rate_limiter('bedrock').call(llm.invoke, prompt).content
+            except Exception as e:
+                if i == len(chain) - 1:
+                    raise
+                _record_fallback(task, model_id, e)
+                continue
+            metrics.record_tokens(task, count_tokens(prompt), count_tokens(response))
+            llm_cache.set(key, response)
+            return response
+    return _llm_flights.do(keys[0], call)
+
+def _stream_llm(prompt, task):
+    """
+    렌더링된 프롬프트로 LLM 응답을 스트리밍하며 텍스트 조각을 순서대로 yield합니다.
+    캐시된 응답은 한 번에 yield하고, 스트리밍이 끝까지 완료된 응답만 캐시에 저장합니다.
+    같은 요청이 이미 스트리밍 중이면 그 스트림의 조각을 처음부터 함께 받습니다.
+    """
+    llm_cache = clients.get_llm_cache()
+    chain = _model_chain(task)
+    keys = _cache_keys(chain, prompt)
+    cached = llm_cache.get(*keys)
+    if cached is not None:
+        metrics.record_cache('llm', 'hit')
+        yield cached
+        return
+    metrics.record_cache('llm', 'miss')
+    yield from _llm_flights.stream(keys[0], lambda: _stream_llm_uncached(prompt, task, chain, keys))
+
+def _stream_llm_uncached(prompt, task, chain, keys):
+    # 첫 조각을 받기 전에 실패한 경우에만 대체 모델로 넘어감 (이미 보낸 조각이 중복되지 않도록)
+    for i, ((model_id, temperature, max_tokens), key) in enumerate(zip(chain, keys)):
+        chunks = []
+        started = time.perf_counter()
+        llm = clients.get_llm(model_id, temperature, max_tokens)
+        try:
+            with metrics.timed('llm.stream', task=task, model=model_id):
+                for chunk in clients.get_rate_limiter('bedrock').stream(lambda: llm.stream(prompt)):
+                    if chunk.content:
+                        if not chunks:
+                            metrics.registry.observe(
+                                'llm_time_to_first_token_seconds', time.perf_counter() - started,
+                                task=task, model=model_id,
+                            )
+                        chunks.append(chunk.content)
+                        yield chunk.content
+        except Exception as e:
+            if chunks or i == len(chain) - 1:
+                raise
+            _record_fallback(task, model_id, e)
+            continue
+        response = "".join(chunks)
+        metrics.record_tokens(task, count_tokens(prompt), count_tokens(response))
+        clients.get_llm_cache().set(key, response)
+        return
+
+@lru_cache(maxsize=1)
+def _get_tokenizer():
+    # 인코딩 객체는 생성 비용이 크므로 프로세스 안에서 한 번만 만들어 재사용
+    import tiktoken
+    return tiktoken.get_encoding("cl100k_base")
+
+def count_tokens(text):
+    return len(_get_tokenizer().encode(text))
+
 def truncate_text(text, max_tokens):
-    tokenizer = tiktoken.get_encoding("cl100k_base")
+    tokenizer = _get_tokenizer()
     tokens = tokenizer.encode(text)
 
     if len(tokens) > max_tokens:
@@ -39,21 +158,105 @@ def truncate_text(text, max_tokens):
 
     return text
 
-def summarize_text(text, max_tokens=MAX_TOKENS):
+_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_BADGE_RE = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_HTML_TAG_RE = re.compile(r"</?[a-zA-Z][^>]*>")
+
+def clean_readme(text):
     """
-    주어진 텍스트를 LLM을 사용하여 요약합니다.
+    요약에 불필요한 배지, 이미지, HTML 태그, 긴 코드 블록을 README에서 제거합니다.
     """
+    def shorten_code_block(match):
+        block = match.group(0)
+        if block.count("\n") > MAX_CODE_BLOCK_LINES:
+            return "[code block omitted]"
+        return block
+
+    text = _CODE_BLOCK_RE.sub(shorten_code_block, text)
+    text = _HTML_COMMENT_RE.sub("", text)
+    text = _BADGE_RE.sub("", text)
+    text = _IMAGE_RE.sub("", text)
+    text = _HTML_TAG_RE.sub("", text)
+    # 제거 후 남는 빈 줄 정리
+    text = re.sub(r"[ \t]+\n", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+def split_into_chunks(text, chunk_tokens=SUMMARY_CHUNK_TOKENS):
+    """
+    텍스트를 문단 경계에서 나누어 각 청크가 chunk_tokens 토큰을 넘지 않도록 합니다.
+    """
+    tokenizer = _get_tokenizer()
+    chunks = []
+    current = []
+    current_tokens = 0
+    for paragraph in text.split("\n\n"):
+        paragraph_tokens = tokenizer.encode(paragraph)
+        # 한 문단이 청크보다 크면 토큰 단위로 자름
+        if len(paragraph_tokens) > chunk_tokens:
+            if current:
+                chunks.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            for start in range(0, len(paragraph_tokens), chunk_tokens):
+                chunks.append(tokenizer.decode(paragraph_tokens[start:start + chunk_tokens]))
+            continue
+        if current and current_tokens + len(paragraph_tokens) > chunk_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(paragraph)
+        current_tokens += len(paragraph_tokens)
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+def _build_summary_prompt(text, max_tokens=MAX_TOKENS):
     # 템플릿 파일에서 프롬프트를 읽어옴
     with open("templates/read_sum_prompt.txt", "r", encoding='utf-8') as file:
         prompt_template = file.read()
-    
-    # 템플릿에 요약할 텍스트 삽입
-    prompt = prompt_template.replace("{{ text }}", text)
 
+    # 템플릿에 최대 길이와 요약할 텍스트 삽입
+    prompt = prompt_template.replace("{{ max_tokens }}", str(max_tokens))
+    return prompt.replace("{{ text }}", text)
+
+def _prepare_summary_input(text, max_tokens):
+    """
+    README를 정리하고, 한 번의 호출에 들어가지 않으면 청크별 요약(map)을 병렬로 수행합니다.
+    반환값은 최종 요약(reduce) 프롬프트에 넣을 텍스트입니다.
+    """
+    text = truncate_text(clean_readme(text), MAX_README_TOKENS)
+    text_tokens = count_tokens(text)
+    while text_tokens > SUMMARY_CHUNK_TOKENS:
+        chunks = split_into_chunks(text, SUMMARY_CHUNK_TOKENS)
+        with ThreadPoolExecutor(max_workers=min(SUMMARY_WORKERS, len(chunks))) as executor:
+            partial_summaries = list(executor.map(
+                lambda chunk: _invoke_llm(_build_summary_prompt(chunk, max_tokens), 'readme_summary'), chunks
+            ))
+        merged = "\n\n".join(partial_summaries)
+        merged_tokens = count_tokens(merged)
+        if merged_tokens >= text_tokens:
+            # 요약이 더 줄어들지 않으면 반복을 멈추고 잘라서 사용
+            return truncate_text(merged, SUMMARY_CHUNK_TOKENS)
+        text, text_tokens = merged, merged_tokens
+    return text
+
+def summarize_text(text, max_tokens=MAX_TOKENS):
+    """
+    주어진 텍스트를 LLM을 사용하여 요약합니다.
+    긴 텍스트는 청크별로 나누어 병렬 요약한 뒤 하나의 요약으로 합칩니다.
+    """
     # LLM을 통해 요약을 생성하여 반환
-    response = llm.invoke(prompt)
-    return response.content  # 객체의 content 속성에 직접 접근
-    
+    summary_input = _prepare_summary_input(text, max_tokens)
+    return _invoke_llm(_build_summary_prompt(summary_input, max_tokens), 'readme_summary')
+
+def stream_summarize_text(text, max_tokens=MAX_TOKENS):
+    """
+    summarize_text의 스트리밍 버전으로, 최종 요약 텍스트 조각을 생성되는 대로 yield합니다.
+    """
+    summary_input = _prepare_summary_input(text, max_tokens)
+    yield from _stream_llm(_build_summary_prompt(summary_input, max_tokens), 'readme_summary')
+
 def summarize_with_template(text, max_length=MAX_TOKENS):
     """
     주어진 텍스트를 지정된 템플릿을 사용해 요약합니다.
@@ -67,48 +270,189 @@ def summarize_with_template(text, max_length=MAX_TOKENS):
 
     try:
         # LLM을 호출하여 요약 생성
-        response = llm.invoke(prompt)
-        return response.content  # content 속성에 직접 접근
+        return _invoke_llm(prompt, 'description_summary')
     except Exception as e:
         return f"Error during summarization: {str(e)}"
 
-def get_recommended_projects(tech_stack, interest_areas):
+def get_github_rate_limit(resource='core'):
+    """
+    마지막으로 관측한 GitHub rate limit(remaining, limit, reset)을 반환합니다.
+    아직 관측한 적이 없거나 리셋 시각이 지났으면 None을 반환합니다.
+    """
+    return clients.get_github_http_cache().rate_limit(resource)
+
+def _read_readme(repo):
+    """
+    리포지토리의 README 텍스트를 가져옵니다.
+    REST /readme 요청은 항상 보내지만 ETag로 재검증되므로 바뀌지 않았으면 GitHub 한도를 쓰지 않으며,
+    같은 blob SHA의 디코딩된 내용은 캐시에서 재사용합니다.
+    GraphQL 검색 결과에 README가 포함되어 있으면 추가 요청 없이 그 내용을 사용합니다.
+    """
+    github_http_cache = clients.get_github_http_cache()
+    if isinstance(repo, GraphQLRepository):
+        if repo.readme_text is not None:
+            if github_http_cache.get_blob(repo.readme_sha) is None:
+                github_http_cache.put_blob(repo.readme_sha, repo.readme_text)
+            return repo.readme_text
+        # 표준 이름이 아닌 README는 REST /readme로 찾음
+    # 검색 결과 객체는 검색한 스레드의 Requester를 가지고 있으므로 현재 스레드의 클라이언트로 다시 만듦 (요청 없음)
+    repo = clients.get_github().get_repo(repo.full_name, lazy=True)
+
+    def fetch():
+        with metrics.timed('github.get_readme'):
+            readme = clients.get_rate_limiter('github').call(repo.get_readme)
+        contents = github_http_cache.get_blob(readme.sha)
+        if contents is None:
+            contents = readme.decoded_content.decode('utf-8')
+            github_http_cache.put_blob(readme.sha, contents)
+        return contents
+    return _github_flights.do(f"/repos/{repo.full_name}/readme", fetch)
+
+def fetch_readme(full_name):
+    """
+    리포지토리 이름으로 README 텍스트를 가져옵니다. 가져오지 못하면 예외를 그대로 발생시킵니다.
+    """
+    return _read_readme(clients.get_github().get_repo(full_name, lazy=True))
+
+def _build_repo_info(repo):
+    """
+    검색 결과 리포지토리 하나에 대해 README를 가져오고 설명을 정리합니다.
+    """
+    incomplete = False
+    try:
+        readme_contents = _read_readme(repo)
+    except Exception as e:
+        readme_contents = "No README available."
+        # README가 없는 리포지토리(404)가 아니라 조회에 실패한 경우는 불완전한 결과로 표시
+        incomplete = getattr(e, 'status', None) != 404
+
+    # 설명이 없으면 기본 값 설정
+    description = repo.description or "No description provided."
+
+    # README 파일이 없는 경우 메시지 출력
+    if not readme_contents:
+        description = "README.md not provided."
+    elif len(description) > 180:
+        # 설명이 너무 길 경우 요약
+        description = summarize_with_template(description, max_length=170)
+
+    # 프로젝트 정보 저장
+    return {
+        'name': repo.full_name,
+        'description': description,
+        'url': repo.html_url,
+        'forks': repo.forks_count,
+        'stars': repo.stargazers_count,
+        'readme': readme_contents if readme_contents else "README.md not provided.",  # README 파일이 없으면 메시지 추가
+        'incomplete': incomplete,
+    }
+
+def _build_fallback_repo_info(repo):
+    """
+    시간 내에 README를 가져오지 못한 리포지토리에 대해 검색 결과 메타데이터만으로 정보를 만듭니다.
+    README가 대체 문구이므로 'incomplete'가 True이며, 저장하거나 공유하는 쪽에서는 이 결과를 걸러야 합니다.
+    """
+    description = repo.description or "No description provided."
+    if len(description) > 180:
+        description = description[:170].rstrip() + "..."
+
+    return {
+        'name': repo.full_name,
+        'description': description,
+        'url': repo.html_url,
+        'forks': repo.forks_count,
+        'stars': repo.stargazers_count,
+        'readme': "No README available.",
+        'incomplete': True,  # README를 가져오지 못해 대체 문구를 넣었음
+    }
+
+def _search_candidates_graphql(graphql, query, ranking_text):
+    """
+    GraphQL로 후보를 검색해 순위를 다시 매기고, 상위 프로젝트의 README를 한 번의 요청으로 채웁니다.
+    """
+    limiter = clients.get_rate_limiter('github')
+    with metrics.timed('github.graphql_search'):
+        pool = limiter.call(graphql.search_repositories, query, CANDIDATE_POOL)
+    candidates = clients.get_reranker().rerank(pool, ranking_text, MAX_RECOMMENDATIONS)
+    try:
+        with metrics.timed('github.graphql_readmes'):
+            limiter.call(graphql.fetch_readmes, candidates)
+    except Exception as e:
+        # README가 비어 있는 프로젝트는 _read_readme가 REST로 가져옴
+        logging.warning(f"GraphQL README fetch failed; falling back to REST per repository: {e}")
+    return candidates
+
+def _search_candidates_rest(query, ranking_text):
+    with metrics.timed('github.search'):
+        # PaginatedList는 순회할 때 요청하므로 목록을 만드는 부분까지 측정
+        repositories = clients.get_github().search_repositories(query=query, sort='stars', order='desc')
+        pool = clients.get_rate_limiter('github_search').call(lambda: list(islice(repositories, CANDIDATE_POOL)))
+    return clients.get_reranker().rerank(pool, ranking_text, MAX_RECOMMENDATIONS)
+
+def get_recommended_projects(tech_stack, interest_areas, concurrent=True,
+                             max_workers=FETCH_WORKERS, timeout=REPO_FETCH_TIMEOUT):
+    """
+    기술 스택과 관심 분야에 맞는 프로젝트를 추천합니다.
+
+    별(star) 순 검색 결과 상위 CANDIDATE_POOL개를 기술 스택, 관심 분야와의 관련도로 다시 정렬한 뒤
+    상위 MAX_RECOMMENDATIONS개만 README 조회와 설명 요약을 수행합니다.
+    GitHub 토큰이 있으면 GraphQL로 검색하고 README를 한 번에 가져오며, 실패하면 REST 검색으로 대체합니다.
+    concurrent=True이면 README 조회와 설명 요약을 리포지토리별로 병렬 실행합니다.
+    timeout(초) 안에 끝나지 않은 리포지토리는 검색 결과 메타데이터만으로 채워지며,
+    결과 순서는 항상 관련도 순서를 유지합니다.
+    GitHub 검색 한도를 초과하면 GitHubRateLimitError를 발생시킵니다.
+    """
+    from github import RateLimitExceededException
+
     query = f"{interest_areas} language:{tech_stack} in:description"
+    ranking_text = f"{tech_stack} {interest_areas}"
 
-    repositories = github.search_repositories(query=query, sort='stars', order='desc')
+    candidates = None
+    graphql = clients.get_github_graphql()
+    if graphql is not None:
+        try:
+            candidates = _github_flights.do(
+                f"/graphql?search={query}&first={CANDIDATE_POOL}",
+                lambda: _search_candidates_graphql(graphql, query, ranking_text),
+            )
+        except Exception as e:
+            logging.warning(f"GraphQL search failed; falling back to REST: {e}")
 
-    top_repos = []
-    for repo in repositories:
+    if candidates is None:
         try:
-            readme_contents = repo.get_readme().decoded_content.decode('utf-8')
-        except Exception:
-            readme_contents = "No README available."
-
-        # 설명이 없으면 기본 값 설정
-        description = repo.description or "No description provided."
-        
-        # README 파일이 없는 경우 메시지 출력
-        if not readme_contents:
-            description = "README.md not provided."
-        elif len(description) > 180:
-            # 설명이 너무 길 경우 요약
-            description = summarize_with_template(description, max_length=170)
-
-        # 프로젝트 정보 저장
-        repo_info = {
-            'name': repo.full_name,
-            'description': description,
-            'url': repo.html_url,
-            'forks': repo.forks_count,
-            'stars': repo.stargazers_count,
-            'readme': readme_contents if readme_contents else "README.md not provided.",  # README 파일이 없으면 메시지 추가
-        }
-        top_repos.append(repo_info)
-        if len(top_repos) >= 5:
-            break
-    return top_repos
+            candidates = _github_flights.do(
+                f"/search/repositories?q={query}&sort=stars&order=desc&per_page={CANDIDATE_POOL}",
+                lambda: _search_candidates_rest(query, ranking_text),
+            )
+        except RateLimitExceededException as e:
+            raise GitHubRateLimitError(str(e)) from e
+
+    if not concurrent:
+        return [_build_repo_info(repo) for repo in candidates]
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(_build_repo_info, repo) for repo in candidates]
+        # 모든 리포지토리가 같은 시점에 시작하므로 하나의 마감 시간을 공유
+        deadline = time.monotonic() + timeout
+        top_repos = []
+        for repo, future in zip(candidates, futures):
+            try:
+                top_repos.append(future.result(timeout=max(0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                logging.warning(f"Timed out fetching {repo.full_name}; using search metadata only.")
+                top_repos.append(_build_fallback_repo_info(repo))
+            except Exception as e:
+                logging.warning(f"Error fetching {repo.full_name}: {e}")
+                top_repos.append(_build_fallback_repo_info(repo))
+        return top_repos
+    finally:
+        # 느린 리포지토리가 목록 반환을 막지 않도록 기다리지 않고 종료
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _build_culture_prompt(repo_name, readme_contents):
+    from langchain_core.prompts import PromptTemplate
 
-def analyze_project_culture(repo_name, readme_contents):
     summarized_readme = summarize_text(readme_contents, max_tokens=MAX_TOKENS)
     summarized_readme = truncate_text(summarized_readme, 2000)
 
@@ -120,38 +464,176 @@ def analyze_project_culture(repo_name, readme_contents):
     )
 
     # 템플릿에 값 대입
-    prompt_text = prompt_template.format(repo_name=repo_name, readme=summarized_readme)
+    return prompt_template.format(repo_name=repo_name, readme=summarized_readme)
+
+def analyze_project_culture(repo_name, readme_contents):
+    prompt_text = _build_culture_prompt(repo_name, readme_contents)
 
-    # LLM 체인을 통해 분석 수행
-    chain = LLMChain(llm=llm, prompt=prompt_template)
-    analysis = chain.run(repo_name=repo_name, readme=summarized_readme)
+    # 렌더링된 프롬프트로 분석 수행 (캐시 키가 프롬프트 전체를 반영하도록)
+    analysis = _invoke_llm(prompt_text, 'culture_analysis')
     return analysis
 
-def generate_contribution_guidelines(repo_name):
+def stream_analyze_project_culture(repo_name, readme_contents):
+    """
+    analyze_project_culture의 스트리밍 버전입니다. README 요약이 끝난 뒤 분석 결과를 조각 단위로 yield합니다.
+    """
+    yield from _stream_llm(_build_culture_prompt(repo_name, readme_contents), 'culture_analysis')
+
+def _build_guidelines_prompt(repo_name):
+    from langchain_core.prompts import PromptTemplate
+
     prompt_template = PromptTemplate(
         input_variables=["repo_name"],
         template=open('templates/contribution_guidelines_prompt.txt', encoding='utf-8').read(),
     )
-    chain = LLMChain(llm=llm, prompt=prompt_template)
-    guidelines = chain.run(repo_name=repo_name)
+    return prompt_template.format(repo_name=repo_name)
+
+def generate_contribution_guidelines(repo_name):
+    guidelines = _invoke_llm(_build_guidelines_prompt(repo_name), 'guidelines')
     return guidelines
 
-# Claude 3.5 Sonnet을 사용하여 텍스트 번역
-def translate_text_with_claude(text, target_language):
+def stream_generate_contribution_guidelines(repo_name):
     """
-    Claude 3.5 Sonnet을 사용하여 텍스트를 지정된 언어로 번역합니다.
+    generate_contribution_guidelines의 스트리밍 버전입니다.
     """
-    prompt = (
+    yield from _stream_llm(_build_guidelines_prompt(repo_name), 'guidelines')
+
+def _build_translation_prompt(text, target_language):
+    return (
         f"Translate the following text into {target_language}. "
         f"Provide only the translated text without any additional comments or explanations. Such as target language\n\n"
         f"{text}"
     )
+
+def _plan_translation(text, target_language):
+    """
+    텍스트를 문단으로 나누고 번역 메모리에서 찾은 번역을 채웁니다.
+    (문단 목록, 문단별 메모리 키, 문단별 번역(없으면 None), 새로 번역할 문단 번호 목록)을 반환합니다.
+    """
+    segments = split_segments(text)
+    keys = [segment_key(segment, target_language) if needs_translation(segment) else None for segment in segments]
+    known = clients.get_translation_memory().get_many([key for key in keys if key])
+    # 번역할 필요가 없는 문단(코드 블록 등)은 원문을 그대로 사용
+    translated = [segment if key is None else known.get(key) for segment, key in zip(segments, keys)]
+    pending = [i for i, value in enumerate(translated) if value is None]
+    for key in keys:
+        if key is not None:
+            metrics.record_cache('translation_memory', 'hit' if key in known else 'miss')
+    return segments, keys, translated, pending
+
+def _remember_translations(keys, pending, translations):
+    clients.get_translation_memory().put_many({keys[i]: value for i, value in zip(pending, translations)})
+
+# Claude를 사용하여 텍스트 번역
+def translate_text_with_claude(text, target_language):
+    """
+    텍스트를 지정된 언어로 번역합니다.
+    이미 대상 언어로 쓰인 텍스트는 그대로 반환하고, 번역 메모리에 없는 문단만 한 번의 호출로 번역합니다.
+    """
     try:
-        response = llm.invoke(prompt)
-        return response.content  # content 속성에 직접 접근
+        if is_same_language(text, target_language):
+            metrics.registry.inc('translation_skipped_total')
+            return text
+
+        segments, keys, translated, pending = _plan_translation(text, target_language)
+        if pending:
+            response = _invoke_llm(
+                build_segments_prompt([segments[i] for i in pending], target_language), 'translation'
+            )
+            translations = parse_segments(response, len(pending))
+            if translations is None:
+                # 번호 표시가 어긋나 문단을 맞출 수 없으면 전체를 한 번에 번역
+                logging.warning("Segmented translation could not be parsed; translating the whole text.")
+                return _invoke_llm(_build_translation_prompt(text, target_language), 'translation')
+            for i, value in zip(pending, translations):
+                translated[i] = value
+            _remember_translations(keys, pending, translations)
+        return "\n\n".join(translated)
     except Exception as e:
         return f"Error during translation: {str(e)}"
 
+def stream_translation(text, target_language):
+    """
+    텍스트를 번역하며 조각을 yield합니다. stream_translate_text_with_claude와 같지만 오류를 그대로 발생시키므로,
+    결과를 저장하거나 공유하는 백그라운드 작업에서 오류 메시지가 번역 결과로 남지 않습니다.
+    번역 메모리에서 찾은 문단은 바로 yield하고, 새로 번역하는 문단은 도착하는 대로 원문 순서에 맞춰 yield합니다.
+    응답의 번호 표시가 빠지거나 어긋나면 아직 출력하지 않은 부분을 번호 없이 다시 번역해 이어서 yield합니다.
+    """
+    if is_same_language(text, target_language):
+        metrics.registry.inc('translation_skipped_total')
+        yield text
+        return
+
+    segments, keys, translated, pending = _plan_translation(text, target_language)
+    next_index = 0  # 다음에 출력할 문단 번호
+
+    def flush(stop):
+        # next_index부터 stop 직전까지의 이미 번역된 문단을 출력할 텍스트로 만듦
+        nonlocal next_index
+        parts = []
+        while next_index < stop:
+            parts.append(("\n\n" if next_index else "") + (translated[next_index] or ""))
+            next_index += 1
+        return "".join(parts)
+
+    if pending:
+        raw = []
+        parser = SegmentStreamParser()
+        started = 0  # 출력하기 시작한 새 번역 문단 수 (번호가 순서대로 도착한 문단만)
+        broken = False
+
+        def emit(pieces):
+            nonlocal next_index, started, broken
+            for number, piece in pieces:
+                if broken:
+                    return
+                if number == started + 1 and number <= len(pending):
+                    # 새 문단이 시작되면 그 앞의 메모리 번역을 먼저 출력
+                    started = number
+                    index = pending[number - 1]
+                    prefix = flush(index) + ("\n\n" if index else "")
+                    next_index = index + 1
+                    yield prefix + piece
+                elif number == started:
+                    yield piece
+                else:
+                    # 번호가 빠지거나 어긋나면 이후 응답은 출력하지 않고 아래에서 다시 번역
+                    broken = True
+
+        prompt = build_segments_prompt([segments[i] for i in pending], target_language)
+        for chunk in _stream_llm(prompt, 'translation'):
+            raw.append(chunk)
+            yield from emit(parser.feed(chunk))
+        yield from emit(parser.close())
+
+        translations = parse_segments("".join(raw), len(pending))
+        if translations is None:
+            # 문단을 맞출 수 없으면 아직 출력하지 않은 부분의 원문을 한 번에 번역
+            # (번호가 하나도 없었으면 전체, 일부만 출력했으면 마지막으로 출력한 문단 다음부터)
+            logging.warning("Segmented translation could not be parsed; translating the remaining text at once.")
+            remaining = segments[pending[started - 1] + 1:] if started else segments
+            next_index = len(segments)
+            if remaining:
+                if started:
+                    yield "\n\n"
+                remaining_prompt = _build_translation_prompt("\n\n".join(remaining), target_language)
+                yield from _stream_llm(remaining_prompt, 'translation')
+            return
+        _remember_translations(keys, pending, translations)
+
+    rest = flush(len(segments))
+    if rest:
+        yield rest
+
+def stream_translate_text_with_claude(text, target_language):
+    """
+    translate_text_with_claude의 스트리밍 버전입니다. 오류가 나면 오류 메시지를 마지막 조각으로 yield합니다.
+    """
+    try:
+        yield from stream_translation(text, target_language)
+    except Exception as e:
+        yield f"Error during translation: {str(e)}"
+
 # 언어 JSON 파일 로드
 def load_language(language):
     """
@@ -0,0 +1,153 @@
+# warm.py
+"""
+자주 들어오는 (기술 스택, 관심 분야) 조합의 추천 목록과 요약, 분석, 번역 결과를 미리 계산합니다.
+
+사용법:
+    python -m warm --queries queries.jsonl
+
+queries.jsonl의 각 줄은 다음 형태의 JSON입니다.
+    {"tech_stack": "Python", "interest_areas": "web development", "target_language": "Korean"}
+
+이미 인덱스에 있고 유효 기간이 지나지 않은 결과는 다시 계산하지 않으므로,
+중단된 실행을 같은 명령으로 다시 시작하면 남은 작업만 수행합니다.
+"""
+
+import argparse
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import clients
+from precomputed import CULTURE_ANALYSIS, GUIDELINES, SUMMARY
+from utils import (
+    analyze_project_culture,
+    generate_contribution_guidelines,
+    get_recommended_projects,
+    summarize_text,
+    translate_text_with_claude,
+)
+
+WARM_FETCH_TIMEOUT = 300  # 미리 계산할 때 README 조회에 허용하는 최대 시간(초)
+
+
+def load_queries(path):
+    queries = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            query = json.loads(line)
+            if not query.get('tech_stack') or not query.get('interest_areas'):
+                logging.warning(f"Skipping line {line_number}: tech_stack and interest_areas are required.")
+                continue
+            queries.append(query)
+    return queries
+
+
+def _ensure(index, repo, kind, compute, target_language=""):
+    """
+    인덱스에 유효한 결과가 있으면 그대로 반환하고, 없으면 계산해서 저장합니다.
+    """
+    value = index.get_artifact(repo, kind, target_language)
+    if value is not None:
+        return value
+    value = compute()
+    # 오류 메시지를 결과로 돌려주는 함수들이 있으므로 저장하지 않음
+    if value.startswith("Error during"):
+        raise RuntimeError(value)
+    index.put_artifact(repo, kind, value, target_language)
+    return value
+
+
+def warm_query(index, query):
+    """
+    검색 결과를 인덱스에 저장하고 추천 프로젝트 목록을 반환합니다.
+    README를 가져오지 못한 프로젝트가 있으면 그 대체 문구가 유효 기간 동안 제공되지 않도록
+    검색 결과를 저장하지 않고, 완전한 프로젝트만 반환합니다(다시 실행하면 나머지를 채움).
+    """
+    projects = index.get_projects(query['tech_stack'], query['interest_areas'])
+    if projects is None:
+        # 앱과 달리 기다리는 사용자가 없으므로 README 조회 제한 시간을 넉넉히 둠
+        projects = get_recommended_projects(
+            query['tech_stack'], query['interest_areas'], timeout=WARM_FETCH_TIMEOUT
+        )
+        incomplete = [project['name'] for project in projects if project.get('incomplete')]
+        if incomplete:
+            logging.warning(
+                f"Not saving results for {query}: README fetch failed for {', '.join(incomplete)}."
+            )
+            return [project for project in projects if not project.get('incomplete')]
+        index.put_projects(query['tech_stack'], query['interest_areas'], projects)
+    return projects
+
+
+def warm_project(index, project, target_languages):
+    """
+    프로젝트 하나의 요약, 문화 분석, 기여 가이드라인과 각 언어의 번역을 인덱스에 저장합니다.
+    """
+    repo = project['name']
+    summary = _ensure(index, repo, SUMMARY, lambda: summarize_text(project['readme']))
+    culture_analysis = _ensure(
+        index, repo, CULTURE_ANALYSIS, lambda: analyze_project_culture(repo, project['readme'])
+    )
+    guidelines = _ensure(index, repo, GUIDELINES, lambda: generate_contribution_guidelines(repo))
+
+    for target_language in target_languages:
+        for kind, source in ((SUMMARY, summary), (CULTURE_ANALYSIS, culture_analysis), (GUIDELINES, guidelines)):
+            _ensure(
+                index, repo, kind,
+                lambda source=source: translate_text_with_claude(source, target_language),
+                target_language,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute recommendations and analyses for popular queries.")
+    parser.add_argument("--queries", required=True, help="JSON Lines file of queries to precompute")
+    parser.add_argument("--workers", type=int, default=4, help="number of parallel workers")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s:%(message)s')
+    index = clients.get_precomputed_index()
+    queries = load_queries(args.queries)
+
+    # 1단계: 검색 결과를 가져오고, 같은 프로젝트가 여러 질의에 나오면 번역 언어를 합쳐 한 번만 처리
+    projects = {}
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(warm_query, index, query): query for query in queries}
+        for future in as_completed(futures):
+            query = futures[future]
+            try:
+                recommended = future.result()
+            except Exception as e:
+                logging.error(f"Search failed for {query}: {e}")
+                continue
+            target_language = (query.get('target_language') or '').strip()
+            for project in recommended:
+                entry = projects.setdefault(project['name'], (project, set()))
+                if target_language:
+                    entry[1].add(target_language)
+
+    # 2단계: 프로젝트별 요약, 분석, 번역
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(warm_project, index, project, sorted(languages)): name
+            for name, (project, languages) in projects.items()
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            name = futures[future]
+            try:
+                future.result()
+                logging.info(f"[{done}/{len(futures)}] warmed {name}")
+            except Exception as e:
+                failed += 1
+                logging.error(f"[{done}/{len(futures)}] failed {name}: {e}")
+
+    logging.info(f"Warmed {len(queries)} queries and {len(projects) - failed}/{len(projects)} projects.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())